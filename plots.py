@@ -4,17 +4,30 @@ Generate all figures for the Mahjong AI paper.
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only saved to PDF
 import matplotlib.pyplot as plt
+from matplotlib.patches import Patch, Rectangle
+from matplotlib.collections import PatchCollection
 import numpy as np
-import seaborn as sns
+import multiprocessing
 import os
 
-# Create plots directory if it doesn't exist
-os.makedirs('./plots', exist_ok=True)
-
-# Set style
+# Set style (module level so every worker process picks it up on import)
 plt.style.use('seaborn-v0_8-paper')
-sns.set_palette("colorblind")
+plt.rcParams['interactive'] = False
+plt.rcParams.update({
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'xtick.top': False,
+    'ytick.right': False,
+    'pdf.compression': 6
+})
+# Seaborn's "colorblind" palette, set directly so seaborn isn't imported
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=[
+    '#0173B2', '#DE8F05', '#029E73', '#D55E00', '#CC78BC',
+    '#CA9161', '#FBAFE4', '#949494', '#ECE133', '#56B4E9'
+])
 
 # Color scheme (colorblind-friendly)
 COLORS = {
@@ -27,27 +40,22 @@ COLORS = {
     'baseline': '#B0B0B0'       # Gray (both baseline)
 }
 
-# Read data
-df = pd.read_csv('res/player_comparison_results.csv')
-
-# Filter for "neither nervous" configurations
-neither = df[df['config_name'] == 'neither'].copy()
-
-print("Loaded data. Generating figures...")
-print(f"Total rows: {len(df)}")
-print(f"'Neither nervous' rows: {len(neither)}")
-
-# ============================================================================
-# Figure 1: Win Rates (fig_winrates.pdf)
-# ============================================================================
-print("\nGenerating Figure 1: Win Rates...")
+# Columns read from the results CSV (everything else is skipped at parse time)
+USED_COLS = [
+    'config_name', 'player1_type', 'player2_type',
+    'p1_win_rate_decisive', 'p2_win_rate_decisive', 'decisive_games',
+    'draw_pct', 'draw_pattern_overlap_pct',
+    'draw_avg_p1_progress', 'draw_avg_p2_progress',
+    'total_games', 'reshuffle_pct', 'games_reshuffled', 'wins_after_reshuffle'
+]
 
-fig, ax = plt.subplots(figsize=(7, 4))
+RESULTS_CSV = 'res/player_comparison_results.csv'
+RESULTS_CACHE = 'res/.player_comparison_results.feather'
 
-# Define pairings and extract data
+# Figure 1 pairings
 pairings_labels = [
     'Bayesian\nvs\nBayesian',
-    'Bayesian\nvs\nGreedy', 
+    'Bayesian\nvs\nGreedy',
     'Bayesian\nvs\nRandom-C',
     'Bayesian\nvs\nPure Rand',
     'Greedy\nvs\nGreedy',
@@ -55,7 +63,6 @@ pairings_labels = [
     'Greedy\nvs\nPure Rand'
 ]
 
-# Extract win rates from neither nervous configs
 pairing_configs = [
     ('bayesian', 'bayesian'),
     ('bayesian', 'greedy'),
@@ -66,75 +73,7 @@ pairing_configs = [
     ('greedy', 'pure_random')
 ]
 
-p1_wins = []
-p2_wins = []
-p1_errors = []
-p2_errors = []
-
-for p1_type, p2_type in pairing_configs:
-    row = neither[(neither['player1_type'] == p1_type) & 
-                  (neither['player2_type'] == p2_type)]
-    if len(row) > 0:
-        p1_win_rate = row.iloc[0]['p1_win_rate_decisive']
-        p2_win_rate = row.iloc[0]['p2_win_rate_decisive']
-        decisive_games = row.iloc[0]['decisive_games']
-        
-        p1_wins.append(p1_win_rate)
-        p2_wins.append(p2_win_rate)
-        
-        # Calculate 95% confidence intervals using binomial proportion
-        # CI = 1.96 * sqrt(p*(1-p)/n)
-        if decisive_games > 0:
-            p1_p = p1_win_rate / 100
-            p2_p = p2_win_rate / 100
-            p1_err = 1.96 * np.sqrt(p1_p * (1 - p1_p) / decisive_games) * 100
-            p2_err = 1.96 * np.sqrt(p2_p * (1 - p2_p) / decisive_games) * 100
-            p1_errors.append(p1_err)
-            p2_errors.append(p2_err)
-        else:
-            p1_errors.append(0)
-            p2_errors.append(0)
-    else:
-        p1_wins.append(0)
-        p2_wins.append(0)
-        p1_errors.append(0)
-        p2_errors.append(0)
-        print(f"Warning: No data for {p1_type} vs {p2_type}")
-
-x = np.arange(len(pairings_labels))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, p1_wins, width, yerr=p1_errors, label='P1/Winner', 
-               color=COLORS['bayesian'], edgecolor='black', linewidth=0.5,
-               capsize=3, error_kw={'linewidth': 1})
-bars2 = ax.bar(x + width/2, p2_wins, width, yerr=p2_errors, label='P2/Loser', 
-               color=COLORS['greedy'], edgecolor='black', linewidth=0.5,
-               capsize=3, error_kw={'linewidth': 1})
-
-# Add reference line at 50%
-ax.axhline(y=50, color='gray', linestyle='--', linewidth=1, alpha=0.5, zorder=0)
-
-ax.set_ylabel('Win Rate in Decisive Games (%)', fontsize=11)
-ax.set_xticks(x)
-ax.set_xticklabels(pairings_labels, fontsize=9)
-ax.set_ylim(0, 100)
-ax.legend(fontsize=10, frameon=True, loc='upper right')
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-
-plt.tight_layout()
-plt.savefig('./plots/fig_winrates.pdf', dpi=300, bbox_inches='tight')
-print("Saved: fig_winrates.pdf")
-plt.close()
-
-# ============================================================================
-# Figure 2: Draw Analysis (fig_drawanalysis.pdf)
-# ============================================================================
-print("\nGenerating Figure 2: Draw Analysis...")
-
-fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(7, 5.5), sharex=True)
-
-# Extended pairings including all baselines
+# Extended pairings including all baselines (Figures 2 and S3)
 all_pairings_labels = [
     'B-B', 'B-G', 'G-G', 'B-RC', 'G-RC', 'B-PR', 'RC-RC', 'RC-PR', 'PR-PR'
 ]
@@ -151,151 +90,195 @@ all_pairing_configs = [
     ('pure_random', 'pure_random')
 ]
 
-# Determine colors based on strategic sophistication
-bar_colors = []
-for p1, p2 in all_pairing_configs:
-    strategic = ['bayesian', 'greedy']
-    baseline = ['random_commit', 'pure_random']
-    
-    if p1 in strategic and p2 in strategic:
-        bar_colors.append(COLORS['strategic'])
-    elif (p1 in strategic and p2 in baseline) or (p2 in strategic and p1 in baseline):
-        bar_colors.append(COLORS['mixed'])
-    else:
-        bar_colors.append(COLORS['baseline'])
-
-# Panel A: Draw Rates
-draw_rates = []
-for p1_type, p2_type in all_pairing_configs:
-    row = neither[(neither['player1_type'] == p1_type) & 
-                  (neither['player2_type'] == p2_type)]
-    if len(row) > 0:
-        draw_rates.append(row.iloc[0]['draw_pct'])
-    else:
-        draw_rates.append(0)
-        print(f"Warning: No data for {p1_type} vs {p2_type}")
-
-ax1.bar(range(len(draw_rates)), draw_rates, color=bar_colors, 
-        edgecolor='black', linewidth=0.5)
-ax1.set_ylabel('Draw Rate (%)', fontsize=11)
-ax1.set_ylim(0, 100)
-ax1.spines['top'].set_visible(False)
-ax1.spines['right'].set_visible(False)
-ax1.set_title('(A) Draw Rates by Agent Pairing', fontsize=11, loc='left', pad=10)
-
-# Panel B: Pattern Overlap
-overlap_rates = []
-for p1_type, p2_type in all_pairing_configs:
-    row = neither[(neither['player1_type'] == p1_type) & 
-                  (neither['player2_type'] == p2_type)]
-    if len(row) > 0:
-        overlap_rates.append(row.iloc[0]['draw_pattern_overlap_pct'])
-    else:
-        overlap_rates.append(0)
-
-ax2.bar(range(len(overlap_rates)), overlap_rates, color=bar_colors, 
-        edgecolor='black', linewidth=0.5)
-ax2.axhline(y=50, color='gray', linestyle='--', linewidth=1, alpha=0.5, zorder=0)
-ax2.set_ylabel('Pattern Overlap in Draws (%)', fontsize=11)
-ax2.set_xlabel('Agent Pairing', fontsize=11)
-ax2.set_xticks(range(len(all_pairings_labels)))
-ax2.set_xticklabels(all_pairings_labels, fontsize=9, rotation=45, ha='right')
-ax2.set_ylim(0, 100)
-ax2.spines['top'].set_visible(False)
-ax2.spines['right'].set_visible(False)
-ax2.set_title('(B) Pattern Overlap in Draws', fontsize=11, loc='left', pad=10)
-
-# Add legend
-from matplotlib.patches import Patch
-legend_elements = [
-    Patch(facecolor=COLORS['strategic'], edgecolor='black', label='Both Strategic'),
-    Patch(facecolor=COLORS['mixed'], edgecolor='black', label='One Strategic'),
-    Patch(facecolor=COLORS['baseline'], edgecolor='black', label='Both Baseline')
+# Figure S1 pairings
+pairings_to_plot = [
+    ('bayesian', 'bayesian', 'Bayesian vs Bayesian'),
+    ('bayesian', 'greedy', 'Bayesian vs Greedy'),
+    ('greedy', 'greedy', 'Greedy vs Greedy')
 ]
-ax1.legend(handles=legend_elements, fontsize=9, frameon=True, loc='lower left')
 
-plt.tight_layout()
-plt.savefig('./plots/fig_drawanalysis.pdf', dpi=300, bbox_inches='tight')
-print("Saved: fig_drawanalysis.pdf")
-plt.close()
+def ci_batch(p_pct, n, z=1.96):
+    """95% binomial confidence half-widths (in %) for win rates p_pct over n games"""
+    # CI = z * sqrt(p*(1-p)/n), and 0 where there were no games
+    p = np.asarray(p_pct, dtype=float) / 100
+    n = np.asarray(n, dtype=float)
+    has_games = n > 0
+    safe_n = np.where(has_games, n, 1)
+    return np.where(has_games, z * np.sqrt(p * (1 - p) / safe_n) * 100, 0.0)
+
+def load_results():
+    """Load the typed results frame, from the Feather cache if it is newer than the CSV
+
+    The cache also has to be newer than this script, since it holds the frame
+    as projected and typed here (USED_COLS, categoricals).
+    """
+    if (os.path.exists(RESULTS_CACHE)
+            and os.path.getmtime(RESULTS_CACHE) > max(os.path.getmtime(RESULTS_CSV),
+                                                      os.path.getmtime(__file__))):
+        return pd.read_feather(RESULTS_CACHE)
+
+    # pyarrow's parser if available, else the C parser with categorical labels
+    try:
+        df = pd.read_csv(RESULTS_CSV, engine='pyarrow',
+                         usecols=USED_COLS, dtype_backend='pyarrow')
+        have_pyarrow = True
+    except ImportError:
+        df = pd.read_csv(RESULTS_CSV, usecols=USED_COLS,
+                         dtype={'config_name': 'category',
+                                'player1_type': 'category',
+                                'player2_type': 'category'})
+        have_pyarrow = False
+
+    # Categorical labels turn the equality filters below into integer code compares
+    for col in ('config_name', 'player1_type', 'player2_type'):
+        df[col] = df[col].astype('category')
+
+    # Feather is Arrow IPC, so the cache is only written when pyarrow is installed;
+    # if res/ is not writable the run simply goes on without a cache
+    if have_pyarrow:
+        try:
+            df.to_feather(RESULTS_CACHE)
+        except OSError:
+            pass
+    return df
+
+# A single Figure per process is reused for every plot it renders
+_fig = None
+
+def reset_figure(width, height):
+    """Return this process's Figure, cleared and resized for the next plot"""
+    global _fig
+    if _fig is None:
+        _fig = plt.figure(figsize=(width, height))
+    _fig.clear()
+    _fig.set_size_inches(width, height)
+    return _fig
+
+def bar_collection(ax, x, heights, width=0.8, bottom=0.0, **kwargs):
+    """Draw one bar series as a single PatchCollection (for bars without error bars)"""
+    bottoms = np.broadcast_to(bottom, len(x))
+    rects = [Rectangle((xi - width/2, b), width, h) for xi, h, b in zip(x, heights, bottoms)]
+    return ax.add_collection(PatchCollection(rects, **kwargs))
 
 # ============================================================================
-# Figure S1: Nervousness Effect (fig_nervousness.pdf) - SUPPLEMENTARY
+# Figure 1: Win Rates (fig_winrates.pdf)
 # ============================================================================
-print("\nGenerating Figure S1: Nervousness Effect...")
+def make_fig_winrates(data):
+    """Win rates in decisive games with 95% confidence intervals"""
+    fig = reset_figure(7, 4)
+    ax = fig.add_subplot()
+
+    x = np.arange(len(pairings_labels))
+    width = 0.35
+
+    ax.bar(x - width/2, data['p1_wins'], width, yerr=data['p1_errors'], label='P1/Winner',
+           color=COLORS['bayesian'], edgecolor='black', linewidth=0.5,
+           capsize=3, error_kw={'linewidth': 1})
+    ax.bar(x + width/2, data['p2_wins'], width, yerr=data['p2_errors'], label='P2/Loser',
+           color=COLORS['greedy'], edgecolor='black', linewidth=0.5,
+           capsize=3, error_kw={'linewidth': 1})
+
+    # Add reference line at 50%
+    ax.axhline(y=50, color='gray', linestyle='--', linewidth=1, alpha=0.5, zorder=0)
+
+    ax.set_ylabel('Win Rate in Decisive Games (%)', fontsize=11)
+    ax.set_xticks(x)
+    ax.set_xticklabels(pairings_labels, fontsize=9)
+    ax.set_ylim(0, 100)
+    ax.legend(fontsize=10, frameon=True, loc='upper right')
 
-fig, ax = plt.subplots(figsize=(7, 4))
+    # Fixed margins (measured once with tight_layout) skip the text-measuring layout pass
+    fig.subplots_adjust(left=0.099, right=0.979, top=0.952, bottom=0.189)
+    fig.savefig('./plots/fig_winrates.pdf', bbox_inches='tight')
+    return 'fig_winrates.pdf'
 
-# Extract nervousness data for key pairings
-pairings_to_plot = [
-    ('bayesian', 'bayesian', 'Bayesian vs Bayesian'),
-    ('bayesian', 'greedy', 'Bayesian vs Greedy'),
-    ('greedy', 'greedy', 'Greedy vs Greedy')
-]
+# ============================================================================
+# Figure 2: Draw Analysis (fig_drawanalysis.pdf)
+# ============================================================================
+def make_fig_drawanalysis(data):
+    """Draw rates and pattern overlap across all pairings"""
+    fig = reset_figure(7, 5.5)
+    ax1, ax2 = fig.subplots(2, 1, sharex=True)
+    bar_colors = data['bar_colors']
+
+    # Panel A: Draw Rates
+    draw_rates = data['draw_rates']
+    bar_collection(ax1, range(len(draw_rates)), draw_rates, facecolors=bar_colors,
+                   edgecolors='black', linewidths=0.5)
+    ax1.set_ylabel('Draw Rate (%)', fontsize=11)
+    ax1.set_ylim(0, 100)
+    ax1.set_title('(A) Draw Rates by Agent Pairing', fontsize=11, loc='left', pad=10)
+
+    # Panel B: Pattern Overlap
+    overlap_rates = data['overlap_rates']
+    bar_collection(ax2, range(len(overlap_rates)), overlap_rates, facecolors=bar_colors,
+                   edgecolors='black', linewidths=0.5)
+    ax2.axhline(y=50, color='gray', linestyle='--', linewidth=1, alpha=0.5, zorder=0)
+    ax2.set_ylabel('Pattern Overlap in Draws (%)', fontsize=11)
+    ax2.set_xlabel('Agent Pairing', fontsize=11)
+    ax2.set_xticks(range(len(all_pairings_labels)))
+    ax2.set_xticklabels(all_pairings_labels, fontsize=9, rotation=45, ha='right')
+    ax2.set_ylim(0, 100)
+    ax2.set_title('(B) Pattern Overlap in Draws', fontsize=11, loc='left', pad=10)
+
+    # Add legend
+    legend_elements = [
+        Patch(facecolor=COLORS['strategic'], edgecolor='black', label='Both Strategic'),
+        Patch(facecolor=COLORS['mixed'], edgecolor='black', label='One Strategic'),
+        Patch(facecolor=COLORS['baseline'], edgecolor='black', label='Both Baseline')
+    ]
+    ax1.legend(handles=legend_elements, fontsize=9, frameon=True, loc='lower left')
+
+    fig.subplots_adjust(left=0.099, right=0.979, top=0.926, bottom=0.155, hspace=0.252)
+    fig.savefig('./plots/fig_drawanalysis.pdf', bbox_inches='tight')
+    return 'fig_drawanalysis.pdf'
 
-colors_nerv = [COLORS['bayesian'], COLORS['random_commit'], COLORS['greedy']]
-
-for idx, (p1, p2, label) in enumerate(pairings_to_plot):
-    pairing_data = df[(df['player1_type'] == p1) & (df['player2_type'] == p2)]
-    
-    # Group by nervousness settings
-    nervousness_levels = []
-    draw_pcts = []
-    
-    for config in ['neither', 'p1_only', 'p2_only', 'both']:
-        config_data = pairing_data[pairing_data['config_name'] == config]
-        if len(config_data) > 0:
-            nervousness_levels.append(config)
-            draw_pcts.append(config_data['draw_pct'].mean())
-    
-    # Convert config names to x positions
-    x_map = {'neither': 0, 'p1_only': 1, 'p2_only': 2, 'both': 3}
-    x_vals = [x_map[n] for n in nervousness_levels]
-    
-    ax.plot(x_vals, draw_pcts, marker='o', linewidth=2, 
-            label=label, color=colors_nerv[idx], markersize=6)
-
-ax.set_xlabel('Nervousness Configuration', fontsize=11)
-ax.set_ylabel('Draw Rate (%)', fontsize=11)
-ax.set_xticks([0, 1, 2, 3])
-ax.set_xticklabels(['Neither\nNervous', 'P1 Only\nNervous', 
-                    'P2 Only\nNervous', 'Both\nNervous'], fontsize=9)
-ax.legend(fontsize=10, frameon=True, loc='upper left')
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.set_ylim(75, 100)
-ax.grid(True, alpha=0.2, linestyle='--')
-
-plt.tight_layout()
-plt.savefig('./plots/fig_nervousness.pdf', dpi=300, bbox_inches='tight')
-print("Saved: fig_nervousness.pdf")
-plt.close()
+# ============================================================================
+# Figure S1: Nervousness Effect (fig_nervousness.pdf) - SUPPLEMENTARY
+# ============================================================================
+def make_fig_nervousness(data):
+    """Draw rate across nervousness configurations for key pairings"""
+    fig = reset_figure(7, 4)
+    ax = fig.add_subplot()
+
+    colors_nerv = [COLORS['bayesian'], COLORS['random_commit'], COLORS['greedy']]
+
+    for idx, (label, x_vals, draw_pcts) in enumerate(data['lines']):
+        ax.plot(x_vals, draw_pcts, marker='o', linewidth=2,
+                label=label, color=colors_nerv[idx], markersize=6)
+
+    ax.set_xlabel('Nervousness Configuration', fontsize=11)
+    ax.set_ylabel('Draw Rate (%)', fontsize=11)
+    ax.set_xticks([0, 1, 2, 3])
+    ax.set_xticklabels(['Neither\nNervous', 'P1 Only\nNervous',
+                        'P2 Only\nNervous', 'Both\nNervous'], fontsize=9)
+    ax.legend(fontsize=10, frameon=True, loc='upper left')
+    ax.set_ylim(75, 100)
+    ax.grid(True, alpha=0.2, linestyle='--')
+
+    fig.subplots_adjust(left=0.099, right=0.975, top=0.952, bottom=0.200)
+    fig.savefig('./plots/fig_nervousness.pdf', bbox_inches='tight')
+    return 'fig_nervousness.pdf'
 
 # ============================================================================
 # Figure S2: Progress at Draw Distribution (fig_progress_histogram.pdf)
 # ============================================================================
-print("\nGenerating Figure S2: Progress Distribution...")
-
-# Get Bayesian vs Bayesian, neither nervous data
-bb_neither = neither[(neither['player1_type'] == 'bayesian') & 
-                     (neither['player2_type'] == 'bayesian')]
+def make_fig_progress_histogram(data):
+    """Average progress at draw for Bayesian vs Bayesian, over the draw regions"""
+    fig = reset_figure(6, 6)
+    ax = fig.add_subplot()
 
-if len(bb_neither) > 0:
-    row = bb_neither.iloc[0]
-    
-    fig, ax = plt.subplots(figsize=(6, 6))
-    
     # Get average progress values
-    p1_avg = row['draw_avg_p1_progress']
-    p2_avg = row['draw_avg_p2_progress']
-    
+    p1_avg = data['p1_avg']
+    p2_avg = data['p2_avg']
+
     # Create scatter plot showing the concept (we don't have individual game data)
     # Instead, we'll create a visualization showing the regions
-    
+
     # Draw regions
     ax.axhline(y=70, color='gray', linestyle='--', linewidth=1, alpha=0.3)
     ax.axvline(x=70, color='gray', linestyle='--', linewidth=1, alpha=0.3)
-    
+
     # Add region labels
     ax.text(85, 85, 'Both High\n(1.2%)', fontsize=10, ha='center', va='center',
             bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.3))
@@ -305,102 +288,200 @@ if len(bb_neither) > 0:
             bbox=dict(boxstyle='round', facecolor='lightcoral', alpha=0.3))
     ax.text(40, 40, 'Both Stuck\n(17.5%)', fontsize=10, ha='center', va='center',
             bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.3))
-    
+
     # Plot average point
-    ax.scatter([p1_avg], [p2_avg], s=200, c='red', marker='*', 
-               edgecolor='black', linewidth=1.5, zorder=10, 
+    ax.scatter([p1_avg], [p2_avg], s=200, c='red', marker='*',
+               edgecolor='black', linewidth=1.5, zorder=10,
                label=f'Average\n(P1={p1_avg:.1f}%, P2={p2_avg:.1f}%)')
-    
+
     # Diagonal line for equal progress
     ax.plot([0, 100], [0, 100], 'k--', linewidth=1, alpha=0.3, label='Equal Progress')
-    
+
     ax.set_xlabel('P1 Final Progress (%)', fontsize=11)
     ax.set_ylabel('P2 Final Progress (%)', fontsize=11)
     ax.set_xlim(0, 100)
     ax.set_ylim(0, 100)
     ax.legend(fontsize=9, frameon=True, loc='lower right')
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
     ax.set_title('Progress at Draw: Bayesian vs Bayesian', fontsize=12, pad=10)
     ax.grid(True, alpha=0.2, linestyle='--')
-    
-    plt.tight_layout()
-    plt.savefig('./plots/fig_progress_histogram.pdf', dpi=300, bbox_inches='tight')
-    print("Saved: fig_progress_histogram.pdf")
-    plt.close()
+
+    fig.subplots_adjust(left=0.116, right=0.957, top=0.930, bottom=0.099)
+    fig.savefig('./plots/fig_progress_histogram.pdf', dpi=150, bbox_inches='tight')
+    return 'fig_progress_histogram.pdf'
 
 # ============================================================================
 # Figure S3: Reshuffle Impact (fig_reshuffle.pdf)
 # ============================================================================
-print("\nGenerating Figure S3: Reshuffle Impact...")
-
-fig, ax = plt.subplots(figsize=(7, 4))
-
-# Calculate percentages for stacked bar chart
-won_before_reshuffle = []
-won_after_reshuffle = []
-drew_after_reshuffle = []
-
-for p1_type, p2_type in all_pairing_configs:
-    row = neither[(neither['player1_type'] == p1_type) & 
-                  (neither['player2_type'] == p2_type)]
-    if len(row) > 0:
-        r = row.iloc[0]
-        total_games = r['total_games']
-        
-        # Games that never reshuffled (won before)
-        never_reshuffled_pct = 100 - r['reshuffle_pct']
-        
-        # Of reshuffled games, what percentage won vs drew
-        if r['games_reshuffled'] > 0:
-            won_after_pct = (r['wins_after_reshuffle'] / total_games) * 100
-            drew_after_pct = r['draw_pct']  # Final draw percentage
-        else:
-            won_after_pct = 0
-            drew_after_pct = r['draw_pct']
-        
-        won_before_reshuffle.append(never_reshuffled_pct)
-        won_after_reshuffle.append(won_after_pct)
-        drew_after_reshuffle.append(drew_after_pct)
-    else:
-        won_before_reshuffle.append(0)
-        won_after_reshuffle.append(0)
-        drew_after_reshuffle.append(0)
-
-x = np.arange(len(all_pairings_labels))
-width = 0.7
-
-# Stacked bars
-p1 = ax.bar(x, won_before_reshuffle, width, label='Won Before Reshuffle',
-            color='#2ecc71', edgecolor='black', linewidth=0.5)
-p2 = ax.bar(x, won_after_reshuffle, width, bottom=won_before_reshuffle,
-            label='Won After Reshuffle', color='#f39c12', edgecolor='black', linewidth=0.5)
-p3 = ax.bar(x, drew_after_reshuffle, width, 
-            bottom=np.array(won_before_reshuffle) + np.array(won_after_reshuffle),
-            label='Drew After Reshuffle', color='#e74c3c', edgecolor='black', linewidth=0.5)
-
-ax.set_ylabel('Percentage of Games (%)', fontsize=11)
-ax.set_xlabel('Agent Pairing', fontsize=11)
-ax.set_xticks(x)
-ax.set_xticklabels(all_pairings_labels, fontsize=9, rotation=45, ha='right')
-ax.set_ylim(0, 105)
-ax.legend(fontsize=9, frameon=True, loc='upper left')
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.set_title('Game Outcomes: Before vs After Reshuffle', fontsize=12, pad=10)
-
-plt.tight_layout()
-plt.savefig('./plots/fig_reshuffle.pdf', dpi=300, bbox_inches='tight')
-print("Saved: fig_reshuffle.pdf")
-plt.close()
-
-print("\n" + "="*70)
-print("ALL FIGURES GENERATED SUCCESSFULLY")
-print("="*70)
-print("\nGenerated files in ./plots/:")
-print("  - fig_winrates.pdf (Figure 1 - required)")
-print("  - fig_drawanalysis.pdf (Figure 2 - required)")
-print("  - fig_nervousness.pdf (Supplementary S1)")
-print("  - fig_progress_histogram.pdf (Supplementary S2)")
-print("  - fig_reshuffle.pdf (Supplementary S3)")
-print("\nReady to include in LaTeX paper!")
\ No newline at end of file
+def make_fig_reshuffle(data):
+    """Stacked game outcomes before and after reshuffle"""
+    fig = reset_figure(7, 4)
+    ax = fig.add_subplot()
+
+    before = np.asarray(data['won_before_reshuffle'])
+    after = np.asarray(data['won_after_reshuffle'])
+    drew = np.asarray(data['drew_after_reshuffle'])
+
+    x = np.arange(len(all_pairings_labels))
+    width = 0.7
+
+    # Stacked bars
+    segments = [
+        (before, 0.0, '#2ecc71', 'Won Before Reshuffle'),
+        (after, before, '#f39c12', 'Won After Reshuffle'),
+        (drew, before + after, '#e74c3c', 'Drew After Reshuffle')
+    ]
+    for heights, bottom, color, _ in segments:
+        bar_collection(ax, x, heights, width, bottom=bottom, facecolors=color,
+                       edgecolors='black', linewidths=0.5)
+
+    ax.set_ylabel('Percentage of Games (%)', fontsize=11)
+    ax.set_xlabel('Agent Pairing', fontsize=11)
+    ax.set_xticks(x)
+    ax.set_xticklabels(all_pairings_labels, fontsize=9, rotation=45, ha='right')
+    ax.set_ylim(0, 105)
+    legend_elements = [Patch(facecolor=color, edgecolor='black', linewidth=0.5, label=label)
+                       for _, _, color, label in segments]
+    ax.legend(handles=legend_elements, fontsize=9, frameon=True, loc='upper left')
+    ax.set_title('Game Outcomes: Before vs After Reshuffle', fontsize=12, pad=10)
+
+    fig.subplots_adjust(left=0.099, right=0.979, top=0.895, bottom=0.214)
+    fig.savefig('./plots/fig_reshuffle.pdf', bbox_inches='tight')
+    return 'fig_reshuffle.pdf'
+
+FIGURES = {
+    'winrates': make_fig_winrates,
+    'drawanalysis': make_fig_drawanalysis,
+    'nervousness': make_fig_nervousness,
+    'progress_histogram': make_fig_progress_histogram,
+    'reshuffle': make_fig_reshuffle
+}
+
+def dispatch(job):
+    """Render one (figure name, payload) job in a worker process"""
+    name, payload = job
+    return FIGURES[name](payload)
+
+if __name__ == '__main__':
+    # Create plots directory if it doesn't exist
+    os.makedirs('./plots', exist_ok=True)
+
+    df = load_results()
+
+    # Filter for "neither nervous" configurations
+    neither = df.loc[df['config_name'] == 'neither']
+
+    # Index by pairing once so each figure can look rows up directly
+    neither_idx = neither.set_index(['player1_type', 'player2_type'], drop=False)
+
+    print("Loaded data. Generating figures...")
+    print(f"Total rows: {len(df)}")
+    print(f"'Neither nervous' rows: {len(neither)}")
+
+    # Each figure gets a payload of plain NumPy arrays/lists, so workers never
+    # need the DataFrame
+    jobs = []
+
+    # Figure 1: win rates from neither nervous configs
+    print("\nPreparing Figure 1: Win Rates...")
+
+    sub = neither_idx.reindex(pairing_configs)
+    for (p1_type, p2_type), missing in zip(pairing_configs, sub['decisive_games'].isna()):
+        if missing:
+            print(f"Warning: No data for {p1_type} vs {p2_type}")
+
+    p1_wins = sub['p1_win_rate_decisive'].fillna(0).to_numpy()
+    p2_wins = sub['p2_win_rate_decisive'].fillna(0).to_numpy()
+    decisive_games = sub['decisive_games'].fillna(0).to_numpy()
+
+    p1_errors = ci_batch(p1_wins, decisive_games)
+    p2_errors = ci_batch(p2_wins, decisive_games)
+
+    jobs.append(('winrates', {'p1_wins': p1_wins, 'p2_wins': p2_wins,
+                              'p1_errors': p1_errors, 'p2_errors': p2_errors}))
+
+    # Figure 2: draw analysis
+    print("\nPreparing Figure 2: Draw Analysis...")
+
+    # Pull every pairing used by Figures 2 and S3 in a single reindex
+    S = neither_idx.reindex(all_pairing_configs)
+
+    # Determine colors based on strategic sophistication
+    # (number of strategic players: 0 = both baseline, 1 = mixed, 2 = both strategic)
+    strategic = np.array(['bayesian', 'greedy'])
+    pairing_types = np.array(all_pairing_configs)
+    n_strategic = np.isin(pairing_types, strategic).sum(axis=1)
+    palette = np.array([COLORS['baseline'], COLORS['mixed'], COLORS['strategic']])
+    bar_colors = palette[n_strategic].tolist()
+
+    for (p1_type, p2_type), missing in zip(all_pairing_configs, S['draw_pct'].isna()):
+        if missing:
+            print(f"Warning: No data for {p1_type} vs {p2_type}")
+    draw_rates = S['draw_pct'].fillna(0).to_numpy()
+    overlap_rates = S['draw_pattern_overlap_pct'].fillna(0).to_numpy()
+
+    jobs.append(('drawanalysis', {'bar_colors': bar_colors, 'draw_rates': draw_rates,
+                                  'overlap_rates': overlap_rates}))
+
+    # Figure S1: nervousness effect
+    print("\nPreparing Figure S1: Nervousness Effect...")
+
+    # Mean draw rate per (pairing, nervousness setting), computed in one pass
+    mean_draw_pct = df.groupby(['player1_type', 'player2_type', 'config_name'],
+                               observed=True)['draw_pct'].mean()
+
+    # Convert config names to x positions
+    x_map = {'neither': 0, 'p1_only': 1, 'p2_only': 2, 'both': 3}
+
+    lines = []
+    for p1, p2, label in pairings_to_plot:
+        x_vals = []
+        draw_pcts = []
+        for config in ['neither', 'p1_only', 'p2_only', 'both']:
+            if (p1, p2, config) in mean_draw_pct.index:
+                x_vals.append(x_map[config])
+                draw_pcts.append(mean_draw_pct[(p1, p2, config)])
+        lines.append((label, x_vals, draw_pcts))
+
+    jobs.append(('nervousness', {'lines': lines}))
+
+    # Figure S2: Bayesian vs Bayesian, neither nervous progress at draw
+    print("\nPreparing Figure S2: Progress Distribution...")
+
+    bb = ('bayesian', 'bayesian')
+    if bb in neither_idx.index:
+        jobs.append(('progress_histogram', {'p1_avg': neither_idx.at[bb, 'draw_avg_p1_progress'],
+                                            'p2_avg': neither_idx.at[bb, 'draw_avg_p2_progress']}))
+
+    # Figure S3: reshuffle impact
+    print("\nPreparing Figure S3: Reshuffle Impact...")
+
+    # Calculate percentages for stacked bar chart (missing pairings plot as zero)
+    # Games that never reshuffled (won before)
+    won_before_reshuffle = (100 - S['reshuffle_pct']).fillna(0).to_numpy()
+
+    # Of reshuffled games, what percentage won vs drew
+    reshuffled = S['games_reshuffled'].fillna(0).to_numpy() > 0
+    won_after_pct = (S['wins_after_reshuffle'] / S['total_games'] * 100).fillna(0).to_numpy()
+    won_after_reshuffle = np.where(reshuffled, won_after_pct, 0.0)
+    drew_after_reshuffle = draw_rates  # Final draw percentage, shared with Figure 2A
+
+    jobs.append(('reshuffle', {'won_before_reshuffle': won_before_reshuffle,
+                               'won_after_reshuffle': won_after_reshuffle,
+                               'drew_after_reshuffle': drew_after_reshuffle}))
+
+    # Figures are independent, so render them in parallel (one process each)
+    print(f"\nRendering {len(jobs)} figures...")
+    with multiprocessing.Pool(len(jobs)) as pool:
+        for filename in pool.map(dispatch, jobs):
+            print(f"Saved: {filename}")
+
+    print("\n" + "="*70)
+    print("ALL FIGURES GENERATED SUCCESSFULLY")
+    print("="*70)
+    print("\nGenerated files in ./plots/:")
+    print("  - fig_winrates.pdf (Figure 1 - required)")
+    print("  - fig_drawanalysis.pdf (Figure 2 - required)")
+    print("  - fig_nervousness.pdf (Supplementary S1)")
+    print("  - fig_progress_histogram.pdf (Supplementary S2)")
+    print("  - fig_reshuffle.pdf (Supplementary S3)")
+    print("\nReady to include in LaTeX paper!")
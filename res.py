@@ -4,48 +4,167 @@ Generate all statistics needed for the Mahjong AI paper.
 Run this to get the numbers to put IN the paper.
 """
 
+import functools
+import io
+import math
+import os
+import pickle
+import sys
+
+RESULTS_CSV = 'res/player_comparison_results.csv'
+STATS_CACHE = 'res/.paper_stats.pkl'
+
+# The report is a pure function of the CSV (and this script), so reuse the
+# last run's text when neither has changed -- before pandas/scipy are imported
+cache_key = (os.path.getmtime(RESULTS_CSV), os.path.getsize(RESULTS_CSV),
+             os.path.getmtime(__file__))
+try:
+    with open(STATS_CACHE, 'rb') as f:
+        cached = pickle.load(f)
+    if cached['key'] == cache_key:
+        sys.stdout.write(cached['text'])
+        sys.exit(0)
+except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+    pass
+
 import pandas as pd
 import numpy as np
-from scipy import stats
-
-df = pd.read_csv('res/player_comparison_results.csv')
-neither = df[df['config_name'] == 'neither'].copy()
-
-print("="*80)
-print("MAHJONG AI PAPER - STATISTICS FOR RESULTS SECTION")
-print("="*80)
-
-print("\n" + "="*80)
-print("BASIC STATISTICS")
-print("="*80)
-print(f"Total configurations: {len(df)}")
-print(f"Total games: {df['total_games'].sum()}")
-print(f"'Neither nervous' configurations: {len(neither)}")
-
-print("\n" + "="*80)
-print("SECTION 4.1.1: BAYESIAN VS GREEDY (PRIMARY RESULT)")
-print("="*80)
-
-bg_neither = neither[(neither['player1_type'] == 'bayesian') & 
-                     (neither['player2_type'] == 'greedy')]
-
-if len(bg_neither) > 0:
-    row = bg_neither.iloc[0]
-    p1_wins = row['p1_wins']
-    p2_wins = row['p2_wins']
-    decisive = row['decisive_games']
-    win_rate = row['p1_win_rate_decisive']
-    
-    # Calculate binomial test p-value (testing if win rate > 50%)
-    p_value = stats.binomtest(p1_wins, n=decisive, p=0.5, alternative='greater').pvalue
+
+# Only the columns this script reports on, with explicit dtypes (no inference pass)
+COUNT_COLS = [
+    'total_games', 'p1_wins', 'p2_wins', 'decisive_games', 'draws',
+    'games_reshuffled', 'wins_after_reshuffle',
+    'draw_both_high_progress', 'draw_both_stuck', 'draw_similar_progress',
+    'draw_p1_stuck_p2_ahead', 'draw_p2_stuck_p1_ahead'
+]
+PCT_COLS = [
+    'p1_win_rate_decisive', 'draw_pct', 'draw_pattern_overlap_pct', 'reshuffle_pct',
+    'draw_avg_p1_progress', 'draw_avg_p2_progress'
+]
+LABEL_COLS = ['config_name', 'player1_type', 'player2_type']
+
+DTYPES = {**{c: 'category' for c in LABEL_COLS},
+          **{c: 'int32' for c in COUNT_COLS},
+          **{c: 'float64' for c in PCT_COLS}}
+
+# pyarrow's multithreaded parser (labels arrive dictionary-encoded) if it is
+# installed, else the C parser; both produce the same dtypes
+try:
+    df = pd.read_csv(RESULTS_CSV, engine='pyarrow',
+                     usecols=list(DTYPES), dtype=DTYPES)
+except ImportError:
+    df = pd.read_csv(RESULTS_CSV, engine='c',
+                     usecols=list(DTYPES), dtype=DTYPES)
+neither = df[df['config_name'] == 'neither']  # read-only view, never mutated
+
+# Shares reported in Sections 4.3.2-4.3.3, derived once per pairing column-wise
+neither = neither.assign(
+    asymmetric_draws=neither['draw_p1_stuck_p2_ahead'] + neither['draw_p2_stuck_p1_ahead'],
+    pct_both_high=lambda d: (d['draw_both_high_progress'] / d['draws']) * 100,
+    pct_both_stuck=lambda d: (d['draw_both_stuck'] / d['draws']) * 100,
+    pct_similar=lambda d: (d['draw_similar_progress'] / d['draws']) * 100,
+    pct_asymmetric=lambda d: (d['asymmetric_draws'] / d['draws']) * 100,
+    reshuffle_resolution_pct=lambda d: (d['wins_after_reshuffle']
+                                        / d['games_reshuffled'].replace(0, np.nan)) * 100,
+)
+
+# Partition every configuration by pairing once; pair_rows() reads a partition
+gb_all = df.groupby(['player1_type', 'player2_type'], observed=True, sort=False)
+
+def pair_rows(p1, p2):
+    """All configurations for a pairing (empty if the pairing was never run)"""
+    try:
+        return gb_all.get_group((p1, p2))
+    except KeyError:
+        return df.iloc[:0]
+
+# One row per (player1_type, player2_type) pairing, looked up by key below
+neither_idx = {(row.player1_type, row.player2_type): row
+               for row in neither.itertuples(index=False)}
+
+bg_neither = neither_idx.get(('bayesian', 'greedy'))
+brc_neither = neither_idx.get(('bayesian', 'random_commit'))
+grc_neither = neither_idx.get(('greedy', 'random_commit'))
+bb_neither = neither_idx.get(('bayesian', 'bayesian'))
+gg_neither = neither_idx.get(('greedy', 'greedy'))
+
+# Win/game totals of every pairing pooled over all configurations, in one pass
+pair_totals = gb_all[['p1_wins', 'p2_wins', 'total_games']].sum()
+
+def pooled_totals(p1, p2):
+    """(P1 wins, P2 wins, games) over all configurations (zeros if never run)
+
+    Kept as NumPy integers, as the per-row sums were, so a pairing without
+    decisive games gives a nan win rate instead of a ZeroDivisionError.
+    """
+    if (p1, p2) in pair_totals.index:
+        return tuple(pair_totals.loc[(p1, p2)].to_numpy(np.int64))
+    return (np.int64(0),) * 3
+
+# Pure-random pairings are pooled over every configuration
+total_p1_wins, total_p2_wins, total_games_bpr = pooled_totals('bayesian', 'pure_random')
+total_p1_wins_g, total_p2_wins_g, _ = pooled_totals('greedy', 'pure_random')
+
+def binom_sf_half(k, n):
+    """P(X >= k) for X ~ Binomial(n, 0.5), summed exactly in integers
+
+    Equal to scipy.stats.binom.sf(k - 1, n, 0.5) (the one-sided 'greater'
+    binomial test) without importing SciPy for seven small tests.
+    """
+    return sum(math.comb(n, i) for i in range(k, n + 1)) / 2**n
+
+def wins_of(row):
+    """(P1 wins, decisive games) of a 'neither' row; (0, 0) if the pairing is missing"""
+    return (row.p1_wins, row.decisive_games) if row is not None else (0, 0)
+
+# One-sided binomial tests (H0: p=0.5, H1: P1 wins more often) as (k, n)
+# pairs. An empty test (n = 0) gives p = 1.
+binom_tests = [
+    wins_of(bg_neither),
+    wins_of(brc_neither),
+    (total_p1_wins, total_p1_wins + total_p2_wins),
+    wins_of(grc_neither),
+    (total_p1_wins_g, total_p1_wins_g + total_p2_wins_g),
+    wins_of(bb_neither),
+    wins_of(gg_neither),
+]
+(p_value, p_value_brc, p_value_bpr, p_value_grc,
+ p_value_gpr, p_value_bb, p_value_gg) = [binom_sf_half(int(k), int(n))
+                                         for k, n in binom_tests]
+
+# The report is buffered and written to stdout (and the cache) once at the end
+report = io.StringIO()
+emit = functools.partial(print, file=report)
+
+emit("="*80)
+emit("MAHJONG AI PAPER - STATISTICS FOR RESULTS SECTION")
+emit("="*80)
+
+emit("\n" + "="*80)
+emit("BASIC STATISTICS")
+emit("="*80)
+emit(f"Total configurations: {len(df)}")
+emit(f"Total games: {df['total_games'].sum()}")
+emit(f"'Neither nervous' configurations: {len(neither)}")
+
+emit("\n" + "="*80)
+emit("SECTION 4.1.1: BAYESIAN VS GREEDY (PRIMARY RESULT)")
+emit("="*80)
+
+if bg_neither is not None:
+    row = bg_neither
+    p1_wins = row.p1_wins
+    p2_wins = row.p2_wins
+    decisive = row.decisive_games
+    win_rate = row.p1_win_rate_decisive
     
-    print(f"\nNeither nervous configuration:")
-    print(f"  Bayesian wins: {p1_wins}")
-    print(f"  Greedy wins: {p2_wins}")
-    print(f"  Win rate: {win_rate:.1f}%")
-    print(f"  Total decisive games: {decisive}")
-    print(f"  Draw rate: {row['draw_pct']:.1f}%")
-    print(f"  P-value (binomial test, H0: p=0.5): {p_value:.4f}")
+    emit(f"\nNeither nervous configuration:")
+    emit(f"  Bayesian wins: {p1_wins}")
+    emit(f"  Greedy wins: {p2_wins}")
+    emit(f"  Win rate: {win_rate:.1f}%")
+    emit(f"  Total decisive games: {decisive}")
+    emit(f"  Draw rate: {row.draw_pct:.1f}%")
+    emit(f"  P-value (binomial test, H0: p=0.5): {p_value:.4f}")
     
     if p_value < 0.001:
         sig_text = "p < 0.001"
@@ -56,172 +175,142 @@ if len(bg_neither) > 0:
     else:
         sig_text = f"p = {p_value:.3f}"
     
-    print(f"\n  → PAPER TEXT: \"The Bayesian agent achieved a {win_rate:.1f}% win rate")
-    print(f"     against the Greedy agent in decisive games (neither nervous")
-    print(f"     configuration: {p1_wins} wins vs. {p2_wins} losses, {sig_text} binomial test)\"")
-
-print("\n" + "-"*80)
-print("ALL BAYESIAN VS GREEDY CONFIGURATIONS (13 or 16 total)")
-print("-"*80)
-
-bg_all = df[(df['player1_type'] == 'bayesian') & (df['player2_type'] == 'greedy')]
-print(f"\nTotal Bayesian vs Greedy configurations: {len(bg_all)}")
-
-win_rates = []
-draw_rates = []
-for idx, row in bg_all.iterrows():
-    if row['decisive_games'] > 0:
-        wr = row['p1_win_rate_decisive']
-        win_rates.append(wr)
-        draw_rates.append(row['draw_pct'])
-
-if win_rates:
-    print(f"\nWin rate statistics:")
-    print(f"  Minimum: {min(win_rates):.1f}%")
-    print(f"  Maximum: {max(win_rates):.1f}%")
-    print(f"  Mean: {np.mean(win_rates):.1f}%")
-    print(f"  Median: {np.median(win_rates):.1f}%")
+    emit(f"\n  → PAPER TEXT: \"The Bayesian agent achieved a {win_rate:.1f}% win rate")
+    emit(f"     against the Greedy agent in decisive games (neither nervous")
+    emit(f"     configuration: {p1_wins} wins vs. {p2_wins} losses, {sig_text} binomial test)\"")
+
+emit("\n" + "-"*80)
+emit("ALL BAYESIAN VS GREEDY CONFIGURATIONS (13 or 16 total)")
+emit("-"*80)
+
+bg_all = pair_rows('bayesian', 'greedy')
+emit(f"\nTotal Bayesian vs Greedy configurations: {len(bg_all)}")
+
+# Only configurations with decisive games have a meaningful win rate
+bg_decisive = bg_all[bg_all['decisive_games'].to_numpy() > 0]
+win_rates = bg_decisive['p1_win_rate_decisive'].to_numpy()
+draw_rates = bg_decisive['draw_pct'].to_numpy()
+
+if win_rates.size:
+    # Extremes are reduced once and reused by every line that reports them
+    max_idx = int(win_rates.argmax())
+    max_wr = float(win_rates[max_idx])
+    min_wr = float(win_rates.min())
+
+    emit(f"\nWin rate statistics:")
+    emit(f"  Minimum: {min_wr:.1f}%")
+    emit(f"  Maximum: {max_wr:.1f}%")
+    emit(f"  Mean: {np.mean(win_rates):.1f}%")
+    emit(f"  Median: {np.median(win_rates):.1f}%")
     
-    # Count configs in different ranges
-    clustered_52_68 = [wr for wr in win_rates if 52 <= wr <= 68]
-    below_52 = [wr for wr in win_rates if wr < 52]
-    above_68 = [wr for wr in win_rates if wr > 68]
+    # Count configs in different ranges with one histogram pass; the 52-68 bin
+    # is closed at 68, so its upper edge is the next float above 68
+    below_52, clustered_52_68, above_68 = (int(c) for c in np.histogram(
+        win_rates, bins=[-np.inf, 52, np.nextafter(68, np.inf), np.inf])[0])
     
-    print(f"\nDistribution:")
-    print(f"  Below 52%: {len(below_52)} configs")
-    print(f"  52-68% range: {len(clustered_52_68)} configs")
-    print(f"  Above 68%: {len(above_68)} configs")
+    emit(f"\nDistribution:")
+    emit(f"  Below 52%: {below_52} configs")
+    emit(f"  52-68% range: {clustered_52_68} configs")
+    emit(f"  Above 68%: {above_68} configs")
     
-    print(f"\n  → PAPER TEXT: \"Across all {len(bg_all)} nervousness configurations,")
-    print(f"     Bayesian win rates ranged from {min(win_rates):.1f}% to {max(win_rates):.1f}%,")
-    print(f"     with most configurations clustered around 52-68%.\"")
+    emit(f"\n  → PAPER TEXT: \"Across all {len(bg_all)} nervousness configurations,")
+    emit(f"     Bayesian win rates ranged from {min_wr:.1f}% to {max_wr:.1f}%,")
+    emit(f"     with most configurations clustered around 52-68%.\"")
     
     # Find highest win rate config
-    max_idx = win_rates.index(max(win_rates))
-    max_row = bg_all.iloc[max_idx]
-    print(f"\n  Highest win rate config: {max_row['config_name']}")
-    print(f"    Win rate: {max(win_rates):.1f}%")
-    print(f"    Decisive games: {max_row['decisive_games']}")
-    print(f"    Draw rate: {max_row['draw_pct']:.1f}%")
+    max_row = next(bg_decisive.iloc[[max_idx]].itertuples(index=False))
+    emit(f"\n  Highest win rate config: {max_row.config_name}")
+    emit(f"    Win rate: {max_wr:.1f}%")
+    emit(f"    Decisive games: {max_row.decisive_games}")
+    emit(f"    Draw rate: {max_row.draw_pct:.1f}%")
 
-print("\n" + "="*80)
-print("SECTION 4.1.2: BAYESIAN VS BASELINES")
-print("="*80)
+emit("\n" + "="*80)
+emit("SECTION 4.1.2: BAYESIAN VS BASELINES")
+emit("="*80)
 
 # Bayesian vs Random-Commit
-brc_neither = neither[(neither['player1_type'] == 'bayesian') & 
-                      (neither['player2_type'] == 'random_commit')]
-if len(brc_neither) > 0:
-    row = brc_neither.iloc[0]
-    p_value_brc = stats.binomtest(row['p1_wins'], n=row['decisive_games'], p=0.5, alternative='greater').pvalue
+if brc_neither is not None:
+    row = brc_neither
     
-    print(f"\nBayesian vs Random-Commit:")
-    print(f"  P1 wins: {row['p1_wins']}")
-    print(f"  P2 wins: {row['p2_wins']}")
-    print(f"  Decisive games: {row['decisive_games']}")
-    print(f"  Win rate: {row['p1_win_rate_decisive']:.1f}%")
-    print(f"  Draw rate: {row['draw_pct']:.1f}%")
-    print(f"  P-value: {p_value_brc:.6f}")
-    print(f"\n  → PAPER TEXT: \"vs. Random-Commit: {row['p1_win_rate_decisive']:.1f}% win rate")
-    print(f"     in decisive games ({row['p1_wins']}/{row['decisive_games']} wins, neither nervous)\"")
+    emit(f"\nBayesian vs Random-Commit:")
+    emit(f"  P1 wins: {row.p1_wins}")
+    emit(f"  P2 wins: {row.p2_wins}")
+    emit(f"  Decisive games: {row.decisive_games}")
+    emit(f"  Win rate: {row.p1_win_rate_decisive:.1f}%")
+    emit(f"  Draw rate: {row.draw_pct:.1f}%")
+    emit(f"  P-value: {p_value_brc:.6f}")
+    emit(f"\n  → PAPER TEXT: \"vs. Random-Commit: {row.p1_win_rate_decisive:.1f}% win rate")
+    emit(f"     in decisive games ({row.p1_wins}/{row.decisive_games} wins, neither nervous)\"")
 
 # Bayesian vs Pure Random - ALL configs
-bpr_all = df[(df['player1_type'] == 'bayesian') & (df['player2_type'] == 'pure_random')]
-total_p1_wins = bpr_all['p1_wins'].sum()
-total_p2_wins = bpr_all['p2_wins'].sum()
-total_games_bpr = bpr_all['total_games'].sum()
-
-if total_p1_wins + total_p2_wins > 0:
-    p_value_bpr = stats.binomtest(total_p1_wins, n=total_p1_wins + total_p2_wins, p=0.5, alternative='greater').pvalue
-else:
-    p_value_bpr = 1.0
-
-print(f"\nBayesian vs Pure Random (all configurations):")
-print(f"  Total P1 wins: {total_p1_wins}")
-print(f"  Total P2 wins: {total_p2_wins}")
-print(f"  Total decisive: {total_p1_wins + total_p2_wins}")
-print(f"  Win rate: {(total_p1_wins/(total_p1_wins + total_p2_wins))*100:.1f}%")
-print(f"  P-value: {p_value_bpr:.6e}")
-print(f"\n  → PAPER TEXT: \"vs. Pure Random: 100% win rate across all configurations")
-print(f"     ({total_p1_wins}/{total_p1_wins + total_p2_wins} total wins, 0 losses)\"")
-
-print("\n" + "="*80)
-print("SECTION 4.1.3: GREEDY VS BASELINES")
-print("="*80)
+emit(f"\nBayesian vs Pure Random (all configurations):")
+emit(f"  Total P1 wins: {total_p1_wins}")
+emit(f"  Total P2 wins: {total_p2_wins}")
+emit(f"  Total decisive: {total_p1_wins + total_p2_wins}")
+emit(f"  Win rate: {(total_p1_wins/(total_p1_wins + total_p2_wins))*100:.1f}%")
+emit(f"  P-value: {p_value_bpr:.6e}")
+emit(f"\n  → PAPER TEXT: \"vs. Pure Random: 100% win rate across all configurations")
+emit(f"     ({total_p1_wins}/{total_p1_wins + total_p2_wins} total wins, 0 losses)\"")
+
+emit("\n" + "="*80)
+emit("SECTION 4.1.3: GREEDY VS BASELINES")
+emit("="*80)
 
 # Greedy vs Random-Commit
-grc_neither = neither[(neither['player1_type'] == 'greedy') & 
-                      (neither['player2_type'] == 'random_commit')]
-if len(grc_neither) > 0:
-    row = grc_neither.iloc[0]
-    p_value_grc = stats.binomtest(row['p1_wins'], n=row['decisive_games'], p=0.5, alternative='greater').pvalue
+if grc_neither is not None:
+    row = grc_neither
     
-    print(f"\nGreedy vs Random-Commit:")
-    print(f"  P1 wins: {row['p1_wins']}")
-    print(f"  Decisive games: {row['decisive_games']}")
-    print(f"  Win rate: {row['p1_win_rate_decisive']:.1f}%")
-    print(f"  P-value: {p_value_grc:.6f}")
-    print(f"\n  → PAPER TEXT: \"vs. Random-Commit: {row['p1_win_rate_decisive']:.1f}% win rate")
-    print(f"     in decisive games ({row['p1_wins']}/{row['decisive_games']} wins)\"")
+    emit(f"\nGreedy vs Random-Commit:")
+    emit(f"  P1 wins: {row.p1_wins}")
+    emit(f"  Decisive games: {row.decisive_games}")
+    emit(f"  Win rate: {row.p1_win_rate_decisive:.1f}%")
+    emit(f"  P-value: {p_value_grc:.6f}")
+    emit(f"\n  → PAPER TEXT: \"vs. Random-Commit: {row.p1_win_rate_decisive:.1f}% win rate")
+    emit(f"     in decisive games ({row.p1_wins}/{row.decisive_games} wins)\"")
 
 # Greedy vs Pure Random - ALL configs
-gpr_all = df[(df['player1_type'] == 'greedy') & (df['player2_type'] == 'pure_random')]
-total_p1_wins_g = gpr_all['p1_wins'].sum()
-total_p2_wins_g = gpr_all['p2_wins'].sum()
-
-if total_p1_wins_g + total_p2_wins_g > 0:
-    p_value_gpr = stats.binomtest(total_p1_wins_g, n=total_p1_wins_g + total_p2_wins_g, p=0.5, alternative='greater').pvalue
-else:
-    p_value_gpr = 1.0
-
-print(f"\nGreedy vs Pure Random (all configurations):")
-print(f"  Total P1 wins: {total_p1_wins_g}")
-print(f"  Total P2 wins: {total_p2_wins_g}")
-print(f"  Win rate: 100%")
-print(f"  P-value: {p_value_gpr:.6e}")
-print(f"\n  → PAPER TEXT: \"vs. Pure Random: 100% win rate across all configurations")
-print(f"     ({total_p1_wins_g}/{total_p1_wins_g + total_p2_wins_g} total wins)\"")
-
-print("\n" + "="*80)
-print("SECTION 4.1.4: SELF-PLAY RESULTS")
-print("="*80)
+emit(f"\nGreedy vs Pure Random (all configurations):")
+emit(f"  Total P1 wins: {total_p1_wins_g}")
+emit(f"  Total P2 wins: {total_p2_wins_g}")
+emit(f"  Win rate: 100%")
+emit(f"  P-value: {p_value_gpr:.6e}")
+emit(f"\n  → PAPER TEXT: \"vs. Pure Random: 100% win rate across all configurations")
+emit(f"     ({total_p1_wins_g}/{total_p1_wins_g + total_p2_wins_g} total wins)\"")
+
+emit("\n" + "="*80)
+emit("SECTION 4.1.4: SELF-PLAY RESULTS")
+emit("="*80)
 
 # Bayesian vs Bayesian
-bb_neither = neither[(neither['player1_type'] == 'bayesian') & 
-                     (neither['player2_type'] == 'bayesian')]
-if len(bb_neither) > 0:
-    row = bb_neither.iloc[0]
-    p_value_bb = stats.binomtest(row['p1_wins'], n=row['decisive_games'], p=0.5, alternative='greater').pvalue
+if bb_neither is not None:
+    row = bb_neither
     
-    print(f"\nBayesian vs Bayesian:")
-    print(f"  P1 wins: {row['p1_wins']}")
-    print(f"  P2 wins: {row['p2_wins']}")
-    print(f"  Decisive games: {row['decisive_games']}")
-    print(f"  P1 win rate: {row['p1_win_rate_decisive']:.1f}%")
-    print(f"  Draw rate: {row['draw_pct']:.1f}%")
-    print(f"  P-value: {p_value_bb:.6f}")
-    print(f"\n  → PAPER TEXT: \"Bayesian vs. Bayesian yielded {row['p1_win_rate_decisive']:.1f}% P1 wins")
-    print(f"     in the 'neither nervous' configuration ({row['p1_wins']}/{row['decisive_games']} decisive games)\"")
+    emit(f"\nBayesian vs Bayesian:")
+    emit(f"  P1 wins: {row.p1_wins}")
+    emit(f"  P2 wins: {row.p2_wins}")
+    emit(f"  Decisive games: {row.decisive_games}")
+    emit(f"  P1 win rate: {row.p1_win_rate_decisive:.1f}%")
+    emit(f"  Draw rate: {row.draw_pct:.1f}%")
+    emit(f"  P-value: {p_value_bb:.6f}")
+    emit(f"\n  → PAPER TEXT: \"Bayesian vs. Bayesian yielded {row.p1_win_rate_decisive:.1f}% P1 wins")
+    emit(f"     in the 'neither nervous' configuration ({row.p1_wins}/{row.decisive_games} decisive games)\"")
 
 # Greedy vs Greedy
-gg_neither = neither[(neither['player1_type'] == 'greedy') & 
-                     (neither['player2_type'] == 'greedy')]
-if len(gg_neither) > 0:
-    row = gg_neither.iloc[0]
-    p_value_gg = stats.binomtest(row['p1_wins'], n=row['decisive_games'], p=0.5, alternative='greater').pvalue
+if gg_neither is not None:
+    row = gg_neither
     
-    print(f"\nGreedy vs Greedy:")
-    print(f"  P1 wins: {row['p1_wins']}")
-    print(f"  Decisive games: {row['decisive_games']}")
-    print(f"  P1 win rate: {row['p1_win_rate_decisive']:.1f}%")
-    print(f"  Draw rate: {row['draw_pct']:.1f}%")
-    print(f"  P-value: {p_value_gg:.6f}")
-    print(f"\n  → PAPER TEXT: \"Greedy vs. Greedy showed similar patterns")
-    print(f"     ({row['p1_win_rate_decisive']:.1f}% P1 wins, {row['draw_pct']:.1f}% draw rates)\"")
-
-print("\n" + "="*80)
-print("TABLE 1: DRAW RATES AND CHARACTERISTICS")
-print("="*80)
+    emit(f"\nGreedy vs Greedy:")
+    emit(f"  P1 wins: {row.p1_wins}")
+    emit(f"  Decisive games: {row.decisive_games}")
+    emit(f"  P1 win rate: {row.p1_win_rate_decisive:.1f}%")
+    emit(f"  Draw rate: {row.draw_pct:.1f}%")
+    emit(f"  P-value: {p_value_gg:.6f}")
+    emit(f"\n  → PAPER TEXT: \"Greedy vs. Greedy showed similar patterns")
+    emit(f"     ({row.p1_win_rate_decisive:.1f}% P1 wins, {row.draw_pct:.1f}% draw rates)\"")
+
+emit("\n" + "="*80)
+emit("TABLE 1: DRAW RATES AND CHARACTERISTICS")
+emit("="*80)
 
 pairings = [
     ('bayesian', 'bayesian', 'Bayesian vs. Bayesian'),
@@ -234,152 +323,164 @@ pairings = [
     ('random_commit', 'pure_random', 'Random-C vs. Pure Rand'),
     ('pure_random', 'pure_random', 'Pure Rand vs. Pure Rand')
 ]
-
-print(f"\n{'Pairing':<30} {'Draw Rate':<12} {'Overlap':<12} {'Reshuffle':<12}")
-print("-"*66)
-
-for p1, p2, label in pairings:
-    row_data = neither[(neither['player1_type'] == p1) & (neither['player2_type'] == p2)]
-    if len(row_data) > 0:
-        row = row_data.iloc[0]
-        print(f"{label:<30} {row['draw_pct']:>6.1f}%      {row['draw_pattern_overlap_pct']:>6.1f}%      {row['reshuffle_pct']:>6.1f}%")
-
-print("\n" + "="*80)
-print("SECTION 4.3.1: PATTERN OVERLAP IN DRAWS")
-print("="*80)
-
 strategic_pairs = [
     ('bayesian', 'bayesian', 'B-B'),
     ('bayesian', 'greedy', 'B-G'),
     ('greedy', 'greedy', 'G-G')
 ]
-
-overlaps_strategic = []
-print("\nStrategic agent pattern overlap:")
-for p1, p2, label in strategic_pairs:
-    row_data = neither[(neither['player1_type'] == p1) & (neither['player2_type'] == p2)]
-    if len(row_data) > 0:
-        overlap = row_data.iloc[0]['draw_pattern_overlap_pct']
-        overlaps_strategic.append(overlap)
-        print(f"  {label}: {overlap:.1f}%")
-
-print(f"\nRange: {min(overlaps_strategic):.1f}% - {max(overlaps_strategic):.1f}%")
-print(f"\n  → PAPER TEXT: \"In 93-99% of draws between strategic agents")
-print(f"     (Bayesian/Greedy), both players were pursuing the same hand pattern.\"")
-print(f"  → OR: \"In {min(overlaps_strategic):.1f}-{max(overlaps_strategic):.1f}% of draws\"")
-
 baseline_pairs = [
     ('random_commit', 'random_commit', 'RC-RC'),
     ('random_commit', 'pure_random', 'RC-PR'),
     ('pure_random', 'pure_random', 'PR-PR')
 ]
 
-overlaps_baseline = []
-print("\nBaseline agent pattern overlap:")
-for p1, p2, label in baseline_pairs:
-    row_data = neither[(neither['player1_type'] == p1) & (neither['player2_type'] == p2)]
-    if len(row_data) > 0:
-        overlap = row_data.iloc[0]['draw_pattern_overlap_pct']
-        overlaps_baseline.append(overlap)
-        print(f"  {label}: {overlap:.1f}%")
-
-print(f"\nRange: {min(overlaps_baseline):.1f}% - {max(overlaps_baseline):.1f}%")
-print(f"\n  → PAPER TEXT: \"pattern overlap dropped dramatically when both")
-print(f"     players were non-strategic ({min(overlaps_baseline):.0f}-{max(overlaps_baseline):.0f}%)\"")
-
-print("\n" + "="*80)
-print("SECTION 4.3.2: PROGRESS AT DRAW")
-print("="*80)
-
-if len(bb_neither) > 0:
-    row = bb_neither.iloc[0]
-    total_draws = row['draws']
-    
-    print(f"\nBayesian vs Bayesian (neither nervous):")
-    print(f"Total draws: {total_draws}")
+# Every pairing reported from here on, joined with its 'neither' row in one
+# merge; 'order' is the position within its list (missing pairings drop out)
+report_pairs = pd.DataFrame(
+    [(p1, p2, label, section, i)
+     for section, pairs in [('table', pairings), ('strategic', strategic_pairs),
+                            ('baseline', baseline_pairs)]
+     for i, (p1, p2, label) in enumerate(pairs)],
+    columns=['player1_type', 'player2_type', 'label', 'section', 'order'])
+joined = report_pairs.merge(neither, on=['player1_type', 'player2_type'], how='inner')
+table1 = joined[joined['section'] == 'table']
+strategic = joined[joined['section'] == 'strategic']
+baseline = joined[joined['section'] == 'baseline']
+
+emit(f"\n{'Pairing':<30} {'Draw Rate':<12} {'Overlap':<12} {'Reshuffle':<12}")
+emit("-"*66)
+
+# Whole table formatted in one to_string() call; the formatters reproduce the
+# fixed-width columns of the header above
+TABLE1_FORMATTERS = {
+    'label': '{:<30}'.format,
+    'draw_pct': '{:>6.1f}%'.format,
+    'draw_pattern_overlap_pct': '     {:>6.1f}%'.format,
+    'reshuffle_pct': '     {:>6.1f}%'.format,
+}
+if len(table1):
+    emit(table1[list(TABLE1_FORMATTERS)].to_string(
+        index=False, header=False, formatters=TABLE1_FORMATTERS))
+
+emit("\n" + "="*80)
+emit("SECTION 4.3.1: PATTERN OVERLAP IN DRAWS")
+emit("="*80)
+
+emit("\nStrategic agent pattern overlap:")
+for row in strategic.itertuples(index=False):
+    emit(f"  {row.label}: {row.draw_pattern_overlap_pct:.1f}%")
+strategic_overlap_min, strategic_overlap_max = \
+    strategic['draw_pattern_overlap_pct'].agg(['min', 'max'])
+
+emit(f"\nRange: {strategic_overlap_min:.1f}% - {strategic_overlap_max:.1f}%")
+emit(f"\n  → PAPER TEXT: \"In 93-99% of draws between strategic agents")
+emit(f"     (Bayesian/Greedy), both players were pursuing the same hand pattern.\"")
+emit(f"  → OR: \"In {strategic_overlap_min:.1f}-{strategic_overlap_max:.1f}% of draws\"")
+
+emit("\nBaseline agent pattern overlap:")
+for row in baseline.itertuples(index=False):
+    emit(f"  {row.label}: {row.draw_pattern_overlap_pct:.1f}%")
+baseline_overlap_min, baseline_overlap_max = \
+    baseline['draw_pattern_overlap_pct'].agg(['min', 'max'])
+
+emit(f"\nRange: {baseline_overlap_min:.1f}% - {baseline_overlap_max:.1f}%")
+emit(f"\n  → PAPER TEXT: \"pattern overlap dropped dramatically when both")
+emit(f"     players were non-strategic ({baseline_overlap_min:.0f}-{baseline_overlap_max:.0f}%)\"")
+
+emit("\n" + "="*80)
+emit("SECTION 4.3.2: PROGRESS AT DRAW")
+emit("="*80)
+
+if bb_neither is not None:
+    row = bb_neither
+    total_draws = row.draws
     
-    print(f"\nProgress categories:")
-    print(f"  Both high (≥70%): {row['draw_both_high_progress']} draws ({(row['draw_both_high_progress']/total_draws)*100:.1f}%)")
-    print(f"  Both stuck (<70%): {row['draw_both_stuck']} draws ({(row['draw_both_stuck']/total_draws)*100:.1f}%)")
-    print(f"  Similar (within 15%): {row['draw_similar_progress']} draws ({(row['draw_similar_progress']/total_draws)*100:.1f}%)")
+    emit(f"\nBayesian vs Bayesian (neither nervous):")
+    emit(f"Total draws: {total_draws}")
     
-    asymmetric = row['draw_p1_stuck_p2_ahead'] + row['draw_p2_stuck_p1_ahead']
-    print(f"  Asymmetric: {asymmetric} draws ({(asymmetric/total_draws)*100:.1f}%)")
-    print(f"    - P1 ahead, P2 stuck: {row['draw_p2_stuck_p1_ahead']}")
-    print(f"    - P2 ahead, P1 stuck: {row['draw_p1_stuck_p2_ahead']}")
+    emit(f"\nProgress categories:")
+    emit(f"  Both high (≥70%): {row.draw_both_high_progress} draws ({row.pct_both_high:.1f}%)")
+    emit(f"  Both stuck (<70%): {row.draw_both_stuck} draws ({row.pct_both_stuck:.1f}%)")
+    emit(f"  Similar (within 15%): {row.draw_similar_progress} draws ({row.pct_similar:.1f}%)")
+    emit(f"  Asymmetric: {row.asymmetric_draws} draws ({row.pct_asymmetric:.1f}%)")
+    emit(f"    - P1 ahead, P2 stuck: {row.draw_p2_stuck_p1_ahead}")
+    emit(f"    - P2 ahead, P1 stuck: {row.draw_p1_stuck_p2_ahead}")
     
-    print(f"\nAverage final progress:")
-    print(f"  P1: {row['draw_avg_p1_progress']:.1f}%")
-    print(f"  P2: {row['draw_avg_p2_progress']:.1f}%")
+    emit(f"\nAverage final progress:")
+    emit(f"  P1: {row.draw_avg_p1_progress:.1f}%")
+    emit(f"  P2: {row.draw_avg_p2_progress:.1f}%")
     
-    print(f"\n  → PAPER TEXT:")
-    print(f"     \"Both high progress (≥70%): {(row['draw_both_high_progress']/total_draws)*100:.1f}% of draws")
-    print(f"      ({row['draw_both_high_progress']}/{total_draws})\"")
-    print(f"     \"Both stuck (<70%): {(row['draw_both_stuck']/total_draws)*100:.1f}% of draws")
-    print(f"      ({row['draw_both_stuck']}/{total_draws})\"")
-    print(f"     \"Similar progress (within 15%): {(row['draw_similar_progress']/total_draws)*100:.1f}% of draws")
-    print(f"      ({row['draw_similar_progress']}/{total_draws})\"")
-    print(f"     \"Asymmetric progress: {(asymmetric/total_draws)*100:.1f}% of draws\"")
-    print(f"     \"Average final progress at draw: P1 = {row['draw_avg_p1_progress']:.1f}%,")
-    print(f"      P2 = {row['draw_avg_p2_progress']:.1f}%\"")
-
-print("\n" + "="*80)
-print("SECTION 4.3.3: RESHUFFLE ANALYSIS")
-print("="*80)
-
-print("\nReshuffle rates:")
-strategic_reshuffle = []
-for p1, p2, label in pairings[:6]:
-    row_data = neither[(neither['player1_type'] == p1) & (neither['player2_type'] == p2)]
-    if len(row_data) > 0:
-        row = row_data.iloc[0]
-        strategic_reshuffle.append(row['reshuffle_pct'])
-        print(f"  {label}: {row['reshuffle_pct']:.1f}%")
-
-print(f"\nRange for strategic/mixed: {min(strategic_reshuffle):.0f}%-{max(strategic_reshuffle):.0f}%")
-print(f"\n  → PAPER TEXT: \"90-98% of games reshuffled at least once\"")
+    emit(f"\n  → PAPER TEXT:")
+    emit(f"     \"Both high progress (≥70%): {row.pct_both_high:.1f}% of draws")
+    emit(f"      ({row.draw_both_high_progress}/{total_draws})\"")
+    emit(f"     \"Both stuck (<70%): {row.pct_both_stuck:.1f}% of draws")
+    emit(f"      ({row.draw_both_stuck}/{total_draws})\"")
+    emit(f"     \"Similar progress (within 15%): {row.pct_similar:.1f}% of draws")
+    emit(f"      ({row.draw_similar_progress}/{total_draws})\"")
+    emit(f"     \"Asymmetric progress: {row.pct_asymmetric:.1f}% of draws\"")
+    emit(f"     \"Average final progress at draw: P1 = {row.draw_avg_p1_progress:.1f}%,")
+    emit(f"      P2 = {row.draw_avg_p2_progress:.1f}%\"")
+
+emit("\n" + "="*80)
+emit("SECTION 4.3.3: RESHUFFLE ANALYSIS")
+emit("="*80)
+
+emit("\nReshuffle rates:")
+reshuffle_rows = table1[table1['order'] < 6]
+for row in reshuffle_rows.itertuples(index=False):
+    emit(f"  {row.label}: {row.reshuffle_pct:.1f}%")
+reshuffle_min, reshuffle_max = reshuffle_rows['reshuffle_pct'].agg(['min', 'max'])
+
+emit(f"\nRange for strategic/mixed: {reshuffle_min:.0f}%-{reshuffle_max:.0f}%")
+emit(f"\n  → PAPER TEXT: \"90-98% of games reshuffled at least once\"")
 
 # Resolution after reshuffle
-if len(bg_neither) > 0:
-    row = bg_neither.iloc[0]
-    if row['games_reshuffled'] > 0:
-        resolution_pct = (row['wins_after_reshuffle'] / row['games_reshuffled']) * 100
+if bg_neither is not None:
+    row = bg_neither
+    if row.games_reshuffled > 0:
+        resolution_pct = row.reshuffle_resolution_pct
         draw_again_pct = 100 - resolution_pct
         
-        print(f"\nResolution after reshuffle (Bayesian vs Greedy):")
-        print(f"  Games reshuffled: {row['games_reshuffled']}")
-        print(f"  Wins after reshuffle: {row['wins_after_reshuffle']}")
-        print(f"  Resolution rate: {resolution_pct:.1f}%")
-        print(f"  Drew again: {draw_again_pct:.1f}%")
+        emit(f"\nResolution after reshuffle (Bayesian vs Greedy):")
+        emit(f"  Games reshuffled: {row.games_reshuffled}")
+        emit(f"  Wins after reshuffle: {row.wins_after_reshuffle}")
+        emit(f"  Resolution rate: {resolution_pct:.1f}%")
+        emit(f"  Drew again: {draw_again_pct:.1f}%")
         
-        print(f"\n  → PAPER TEXT: \"Of reshuffled games, only {resolution_pct:.0f}%")
-        print(f"     resolved to a winner\"")
-        print(f"     \"{draw_again_pct:.0f}% of reshuffled games drew again\"")
-
-print("\n" + "="*80)
-print("SECTION 5: DRAW RATE RANGES FOR DISCUSSION")
-print("="*80)
-
-strategic_draws = []
-for p1, p2, label in pairings[:3]:
-    row_data = neither[(neither['player1_type'] == p1) & (neither['player2_type'] == p2)]
-    if len(row_data) > 0:
-        strategic_draws.append(row_data.iloc[0]['draw_pct'])
-
-print(f"\nDraw rates for strategic matchups:")
-print(f"  Range: {min(strategic_draws):.1f}% - {max(strategic_draws):.1f}%")
-print(f"\n  → PAPER TEXT (Discussion): \"the extremely high draw rates")
-print(f"     ({min(strategic_draws):.1f}-{max(strategic_draws):.1f}% for strategic agents)\"")
-
-print("\n" + "="*80)
-print("ABSTRACT STATISTICS")
-print("="*80)
-
-if len(bg_neither) > 0:
-    row = bg_neither.iloc[0]
-    print(f"\nFor abstract:")
-    print(f"  Primary win rate: {row['p1_win_rate_decisive']:.1f}%")
-    print(f"  Win rate range: {min(win_rates):.1f}%-{max(win_rates):.1f}%")
-    print(f"  Most configs cluster: 52-68% ({len(clustered_52_68)}/{len(win_rates)} configs)")
-    print(f"  Draw rates: 81-100%")
-    print(f"  Pattern overlap (strategic): {min(overlaps_strategic):.0f}-{max(overlaps_strategic):.0f}%")
+        emit(f"\n  → PAPER TEXT: \"Of reshuffled games, only {resolution_pct:.0f}%")
+        emit(f"     resolved to a winner\"")
+        emit(f"     \"{draw_again_pct:.0f}% of reshuffled games drew again\"")
+
+emit("\n" + "="*80)
+emit("SECTION 5: DRAW RATE RANGES FOR DISCUSSION")
+emit("="*80)
+
+strategic_draw_min, strategic_draw_max = \
+    table1.loc[table1['order'] < 3, 'draw_pct'].agg(['min', 'max'])
+
+emit(f"\nDraw rates for strategic matchups:")
+emit(f"  Range: {strategic_draw_min:.1f}% - {strategic_draw_max:.1f}%")
+emit(f"\n  → PAPER TEXT (Discussion): \"the extremely high draw rates")
+emit(f"     ({strategic_draw_min:.1f}-{strategic_draw_max:.1f}% for strategic agents)\"")
+
+emit("\n" + "="*80)
+emit("ABSTRACT STATISTICS")
+emit("="*80)
+
+if bg_neither is not None:
+    row = bg_neither
+    emit(f"\nFor abstract:")
+    emit(f"  Primary win rate: {row.p1_win_rate_decisive:.1f}%")
+    emit(f"  Win rate range: {min_wr:.1f}%-{max_wr:.1f}%")
+    emit(f"  Most configs cluster: 52-68% ({clustered_52_68}/{len(win_rates)} configs)")
+    emit(f"  Draw rates: 81-100%")
+    emit(f"  Pattern overlap (strategic): {strategic_overlap_min:.0f}-{strategic_overlap_max:.0f}%")
+
+text = report.getvalue()
+sys.stdout.write(text)
+# The cache is only a shortcut; an unwritable res/ just means no cache
+try:
+    with open(STATS_CACHE, 'wb') as f:
+        pickle.dump({'key': cache_key, 'text': text}, f)
+except OSError:
+    pass
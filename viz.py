@@ -4,21 +4,138 @@ Visualize draw game patterns from Mahjong AI benchmark
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # figures are only written to files, also from worker processes
 import matplotlib.pyplot as plt
+from matplotlib import cbook
 import seaborn as sns
 import numpy as np
+import colorsys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
 
+# No label uses mathtext, and long paths are simplified and drawn in chunks
+plt.rcParams.update({
+    'text.parse_math': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
+# PNG output: 150 dpi, fast zlib level, no Software metadata chunk
+SAVEFIG_KWARGS = {
+    'dpi': 150,
+    'pil_kwargs': {'compress_level': 1},
+    'metadata': {'Software': None},
+}
+
+# Overlap categories in display order; parsed straight into an ordered Categorical
+OVERLAP_CATEGORIES = ['0-24%', '25-49%', '50-74%', '75-99%', '100% (Exact)']
+
+# The only columns the plots and summary read, with compact numeric dtypes.
+# Progress stays float64: it is k/14 scaled to percent, and float32 rounding
+# moves values across histogram edges and breaks ties between matchup medians.
+DTYPES = {
+    'p1_type': str,
+    'p2_type': str,
+    'player_progress': np.float64,
+    'opponent_progress': np.float64,
+    'overlap_pct': np.float32,
+    'overlap_category': pd.CategoricalDtype(OVERLAP_CATEGORIES, ordered=True),
+    'final_turn': np.int32,
+}
+
 def load_data(csv_path):
     """Load the pattern overlap details CSV"""
-    df = pd.read_csv(csv_path)
+    # pyarrow's multithreaded parser if it is installed, else the C parser in
+    # round-trip mode so that both parse the progress floats exactly alike
+    try:
+        df = pd.read_csv(csv_path, engine='pyarrow', usecols=list(DTYPES), dtype=DTYPES)
+    except ImportError:
+        df = pd.read_csv(csv_path, engine='c', usecols=list(DTYPES), dtype=DTYPES,
+                         float_precision='round_trip')
     # Convert progress to percentages if needed
     if df['player_progress'].max() <= 1.0:
         df['player_progress'] = df['player_progress'] * 100
         df['opponent_progress'] = df['opponent_progress'] * 100
+    
+    # Derived progress columns shared by several plots and the summary
+    p1 = df['player_progress'].to_numpy()
+    p2 = df['opponent_progress'].to_numpy()
+    df['progress_diff'] = p1 - p2
+    df['progress_diff_abs'] = np.abs(df['progress_diff'].to_numpy())
+    df['progress_sum'] = p1 + p2
     return df
 
+def uniform_histogram2d(x, y, bins, lo, hi):
+    """np.histogram2d for equal-width bins over [lo, hi] on both axes
+
+    Bin indices come from the bin width and the counts from a single bincount,
+    with no edge search. As in numpy, the last bin is closed and points outside
+    the range are dropped.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(lo, hi, bins + 1)
+    keep = (x >= lo) & (x <= hi) & (y >= lo) & (y <= hi)
+
+    def bin_index(values):
+        idx = np.minimum(((values - lo) * (bins / (hi - lo))).astype(np.intp), bins - 1)
+        # The scaling can round a value next to an edge into the wrong bin;
+        # move it back against the actual edges, as np.histogram does
+        idx[values < edges[idx]] -= 1
+        idx[(values >= edges[idx + 1]) & (idx != bins - 1)] += 1
+        return idx
+
+    ix = bin_index(x[keep])
+    iy = bin_index(y[keep])
+    hist = np.bincount(ix * bins + iy, minlength=bins * bins).reshape(bins, bins)
+    return hist.astype(np.float64), edges, edges
+
+def plot_share_barh(ax, counts, colors):
+    """Horizontal bars of each category's share of the draws, labelled in %"""
+    shares = counts.to_numpy() / counts.sum() * 100
+    positions = np.arange(len(counts))
+    bars = ax.barh(positions, shares, color=colors)
+    ax.set_yticks(positions)
+    ax.set_yticklabels(counts.index)
+    ax.bar_label(bars, labels=[f'{share:.1f}%' for share in shares],
+                 padding=3, fontweight='bold')
+    ax.set_xlim(0, shares.max() * 1.15)
+    ax.set_xlabel('Share of Draw Games (%)', fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3, axis='x')
+
+def draw_boxes(ax, box_stats, positions, labels, palette, orientation='vertical'):
+    """Draw precomputed box statistics with bxp in seaborn's boxplot style
+
+    palette holds one (desaturated) color per label; the boxes are placed at
+    positions, which index into labels, so empty categories keep their slot.
+    Lines are the gray seaborn derives from the palette's darkest color.
+    """
+    line_gray = min(colorsys.rgb_to_hls(*c)[1] for c in palette) * 0.6
+    line_color = (line_gray, line_gray, line_gray)
+    boxes = ax.bxp(box_stats, positions=positions,
+                   widths=0.8, capwidths=0.4, orientation=orientation,
+                   patch_artist=True, manage_ticks=False,
+                   boxprops={'edgecolor': line_color},
+                   medianprops={'color': line_color, 'solid_capstyle': 'butt'},
+                   whiskerprops={'color': line_color, 'solid_capstyle': 'butt'},
+                   capprops={'color': line_color},
+                   flierprops={'markeredgecolor': line_color})
+    for box, position in zip(boxes['boxes'], positions):
+        box.set_facecolor(palette[position])
+    # Categorical axis as seaborn sets it up: one tick per label, no grid lines
+    slots = np.arange(len(labels))
+    if orientation == 'horizontal':
+        ax.set_yticks(slots, labels)
+        ax.set_ylim(len(labels) - 0.5, -0.5)
+        ax.yaxis.grid(False)
+    else:
+        ax.set_xticks(slots, labels)
+        ax.set_xlim(-0.5, len(labels) - 0.5)
+        ax.xaxis.grid(False)
+
 def plot_progress_scatter(df, output_dir):
     """Scatter plot of P1 vs P2 progress at draw"""
     fig, ax = plt.subplots(figsize=(10, 10))
@@ -26,7 +143,8 @@ def plot_progress_scatter(df, output_dir):
     # Create scatter plot
     scatter = ax.scatter(df['player_progress'], df['opponent_progress'], 
                         alpha=0.6, s=100, c=df['overlap_pct'], 
-                        cmap='RdYlGn_r', edgecolors='black', linewidth=0.5)
+                        cmap='RdYlGn_r', edgecolors='black', linewidth=0.5,
+                        rasterized=True)
     
     # Add diagonal line (equal progress)
     ax.plot([0, 100], [0, 100], 'k--', alpha=0.3, linewidth=2, label='Equal Progress')
@@ -60,24 +178,24 @@ def plot_progress_scatter(df, output_dir):
             bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.3))
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'draw_progress_scatter.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved: draw_progress_scatter.png")
+    plt.savefig(output_dir / 'draw_progress_scatter.png', **SAVEFIG_KWARGS)
     plt.close()
+    return 'draw_progress_scatter.png'
 
 def plot_progress_difference_histogram(df, output_dir):
     """Histogram of progress differences"""
-    df['progress_diff'] = df['player_progress'] - df['opponent_progress']
-    
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
     
     # Histogram
-    ax1.hist(df['progress_diff'], bins=30, edgecolor='black', alpha=0.7, color='steelblue')
+    counts, edges = np.histogram(df['progress_diff'].to_numpy(), bins=30)
+    ax1.stairs(counts, edges, fill=True, edgecolor='black', linewidth=1,
+               alpha=0.7, facecolor='steelblue')
     ax1.axvline(0, color='red', linestyle='--', linewidth=2, label='Equal Progress')
     ax1.set_xlabel('Progress Difference (P1 - P2) (%)', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Number of Draw Games', fontsize=12, fontweight='bold')
     ax1.set_title('Distribution of Progress Differences at Draw', fontsize=14, fontweight='bold')
     ax1.grid(True, alpha=0.3, axis='y')
-    ax1.legend()
+    ax1.legend(loc='upper right')  # clear of the stats box
     
     # Add statistics text
     stats_text = f"Mean: {df['progress_diff'].mean():.1f}%\n"
@@ -87,12 +205,28 @@ def plot_progress_difference_histogram(df, output_dir):
              verticalalignment='top', fontsize=10,
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    # Box plot by matchup type
-    df['matchup'] = df['p1_type'] + ' vs ' + df['p2_type']
-    matchup_order = df.groupby('matchup')['progress_diff'].median().sort_values().index
-    
-    sns.boxplot(data=df, y='matchup', x='progress_diff', ax=ax2, 
-                order=matchup_order, palette='Set2')
+    # Box plot by matchup type, ordered by median. Matchups are integer codes
+    # (p1 code * n_p2 + p2 code), which sort the same way as the 'p1 vs p2'
+    # strings; labels are built only for the codes present, and the box
+    # statistics are computed once per group and drawn with draw_boxes
+    p1_types = df['p1_type'].astype('category').cat
+    p2_types = df['p2_type'].astype('category').cat
+    n_p2 = len(p2_types.categories)
+    matchup_codes = p1_types.codes.to_numpy(np.int32) * n_p2 + p2_types.codes.to_numpy()
+    progress_diff = df['progress_diff'].to_numpy()
+    matchup_groups = {code: progress_diff[matchup_codes == code]
+                      for code in np.unique(matchup_codes)}
+    present_codes = np.fromiter(matchup_groups, dtype=np.int32)
+    medians = np.array([np.median(matchup_groups[code]) for code in present_codes])
+    order_codes = present_codes[np.argsort(medians)]  # same tie order as Series.sort_values
+    matchup_order = [f"{p1_types.categories[code // n_p2]} vs {p2_types.categories[code % n_p2]}"
+                     for code in order_codes]
+    box_stats = cbook.boxplot_stats(
+        [matchup_groups[code] for code in order_codes], whis=1.5)
+    
+    draw_boxes(ax2, box_stats, np.arange(len(matchup_order)), matchup_order,
+               sns.color_palette('Set2', len(matchup_order), desat=0.75),
+               orientation='horizontal')
     ax2.axvline(0, color='red', linestyle='--', linewidth=2, alpha=0.5)
     ax2.set_xlabel('Progress Difference (P1 - P2) (%)', fontsize=12, fontweight='bold')
     ax2.set_ylabel('Player Matchup', fontsize=12, fontweight='bold')
@@ -100,21 +234,18 @@ def plot_progress_difference_histogram(df, output_dir):
     ax2.grid(True, alpha=0.3, axis='x')
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'draw_progress_differences.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved: draw_progress_differences.png")
+    plt.savefig(output_dir / 'draw_progress_differences.png', **SAVEFIG_KWARGS)
     plt.close()
+    return 'draw_progress_differences.png'
 
 def plot_progress_heatmap(df, output_dir):
     """2D histogram heatmap of draw outcomes"""
     fig, ax = plt.subplots(figsize=(12, 10))
     
-    # Create 2D histogram
-    x_bins = np.arange(0, 101, 10)
-    y_bins = np.arange(0, 101, 10)
-    
-    hist, x_edges, y_edges = np.histogram2d(
-        df['player_progress'], df['opponent_progress'], 
-        bins=[x_bins, y_bins]
+    # Create 2D histogram (10 uniform bins of 10% per axis)
+    hist, x_edges, y_edges = uniform_histogram2d(
+        df['player_progress'].to_numpy(), df['opponent_progress'].to_numpy(),
+        bins=10, lo=0, hi=100
     )
     
     # Plot heatmap
@@ -140,29 +271,38 @@ def plot_progress_heatmap(df, output_dir):
     cbar = plt.colorbar(im, ax=ax)
     cbar.set_label('Number of Draw Games', fontsize=12, fontweight='bold')
     
-    # Add text annotations for counts in each cell
-    for i in range(len(x_edges)-1):
-        for j in range(len(y_edges)-1):
-            count = int(hist[i, j])
-            if count > 0:
-                text_color = 'white' if count > hist.max()/2 else 'black'
-                ax.text((x_edges[i] + x_edges[i+1])/2, 
-                       (y_edges[j] + y_edges[j+1])/2,
-                       str(count), ha='center', va='center', 
-                       color=text_color, fontsize=8, fontweight='bold')
+    # Add text annotations for counts in each non-empty cell
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    nonzero = np.argwhere(hist > 0)
+    counts = hist[nonzero[:, 0], nonzero[:, 1]].astype(int)
+    text_colors = np.where(counts > hist.max() / 2, 'white', 'black')
+    for (i, j), count, text_color in zip(nonzero, counts, text_colors):
+        ax.text(x_centers[i], y_centers[j], str(count), ha='center', va='center',
+                color=text_color, fontsize=8, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'draw_progress_heatmap.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved: draw_progress_heatmap.png")
+    plt.savefig(output_dir / 'draw_progress_heatmap.png', **SAVEFIG_KWARGS)
     plt.close()
+    return 'draw_progress_heatmap.png'
 
 def plot_progress_by_overlap(df, output_dir):
     """Box plots of progress by overlap category"""
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
+    # Box statistics per overlap category (by categorical code); categories
+    # without draws keep an empty slot on the axis
+    overlap_codes = df['overlap_category'].cat.codes.to_numpy()
+    present_codes = np.flatnonzero(np.bincount(overlap_codes[overlap_codes >= 0],
+                                               minlength=len(OVERLAP_CATEGORIES)))
+    player_progress = df['player_progress'].to_numpy()
+    opponent_progress = df['opponent_progress'].to_numpy()
+    overlap_palette = sns.color_palette('viridis', len(OVERLAP_CATEGORIES), desat=0.75)
+    
     # P1 Progress by Overlap
-    sns.boxplot(data=df, x='overlap_category', y='player_progress', ax=axes[0, 0],
-                palette='viridis', order=['0-24%', '25-49%', '50-74%', '75-99%', '100% (Exact)'])
+    draw_boxes(axes[0, 0], cbook.boxplot_stats(
+                   [player_progress[overlap_codes == code] for code in present_codes], whis=1.5),
+               present_codes, OVERLAP_CATEGORIES, overlap_palette)
     axes[0, 0].set_title('Player 1 Progress by Pattern Overlap', fontsize=14, fontweight='bold')
     axes[0, 0].set_xlabel('Pattern Overlap Category', fontsize=12, fontweight='bold')
     axes[0, 0].set_ylabel('Progress (%)', fontsize=12, fontweight='bold')
@@ -171,8 +311,9 @@ def plot_progress_by_overlap(df, output_dir):
     axes[0, 0].legend()
     
     # P2 Progress by Overlap
-    sns.boxplot(data=df, x='overlap_category', y='opponent_progress', ax=axes[0, 1],
-                palette='viridis', order=['0-24%', '25-49%', '50-74%', '75-99%', '100% (Exact)'])
+    draw_boxes(axes[0, 1], cbook.boxplot_stats(
+                   [opponent_progress[overlap_codes == code] for code in present_codes], whis=1.5),
+               present_codes, OVERLAP_CATEGORIES, overlap_palette)
     axes[0, 1].set_title('Player 2 Progress by Pattern Overlap', fontsize=14, fontweight='bold')
     axes[0, 1].set_xlabel('Pattern Overlap Category', fontsize=12, fontweight='bold')
     axes[0, 1].set_ylabel('Progress (%)', fontsize=12, fontweight='bold')
@@ -181,50 +322,56 @@ def plot_progress_by_overlap(df, output_dir):
     axes[0, 1].legend()
     
     # Average progress by overlap
-    overlap_stats = df.groupby('overlap_category').agg({
-        'player_progress': 'mean',
-        'opponent_progress': 'mean'
-    }).reset_index()
-    
-    x_pos = np.arange(len(overlap_stats))
+    # Per-category means as weighted bincounts over the categorical codes,
+    # in OVERLAP_CATEGORIES order; categories without draws are left out
+    known = overlap_codes >= 0
+    n_categories = len(OVERLAP_CATEGORIES)
+    n_per_category = np.bincount(overlap_codes[known], minlength=n_categories)
+    observed = n_per_category > 0
+    overlap_labels = np.array(OVERLAP_CATEGORIES)[observed]
+    p1_means = (np.bincount(overlap_codes[known],
+                            weights=df['player_progress'].to_numpy()[known],
+                            minlength=n_categories)[observed] / n_per_category[observed])
+    p2_means = (np.bincount(overlap_codes[known],
+                            weights=df['opponent_progress'].to_numpy()[known],
+                            minlength=n_categories)[observed] / n_per_category[observed])
+    
+    x_pos = np.arange(len(overlap_labels))
     width = 0.35
     
-    axes[1, 0].bar(x_pos - width/2, overlap_stats['player_progress'], 
+    axes[1, 0].bar(x_pos - width/2, p1_means, 
                    width, label='Player 1', alpha=0.8, color='steelblue')
-    axes[1, 0].bar(x_pos + width/2, overlap_stats['opponent_progress'], 
+    axes[1, 0].bar(x_pos + width/2, p2_means, 
                    width, label='Player 2', alpha=0.8, color='coral')
     axes[1, 0].set_xlabel('Pattern Overlap Category', fontsize=12, fontweight='bold')
     axes[1, 0].set_ylabel('Average Progress (%)', fontsize=12, fontweight='bold')
     axes[1, 0].set_title('Average Progress by Overlap Category', fontsize=14, fontweight='bold')
     axes[1, 0].set_xticks(x_pos)
-    axes[1, 0].set_xticklabels(overlap_stats['overlap_category'], rotation=45, ha='right')
+    axes[1, 0].set_xticklabels(overlap_labels, rotation=45, ha='right')
     axes[1, 0].legend()
     axes[1, 0].grid(True, alpha=0.3, axis='y')
     axes[1, 0].axhline(70, color='red', linestyle='--', alpha=0.3)
     
-    # Overlap distribution
-    overlap_counts = df['overlap_category'].value_counts()
-    axes[1, 1].pie(overlap_counts, labels=overlap_counts.index, autopct='%1.1f%%',
-                   startangle=90, colors=sns.color_palette('viridis', len(overlap_counts)))
+    # Overlap distribution (counted once, in category order, empty categories included)
+    overlap_counts = df['overlap_category'].value_counts(sort=False)
+    plot_share_barh(axes[1, 1], overlap_counts,
+                    sns.color_palette('viridis', len(overlap_counts)))
     axes[1, 1].set_title('Distribution of Overlap Categories', fontsize=14, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'draw_progress_by_overlap.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved: draw_progress_by_overlap.png")
+    plt.savefig(output_dir / 'draw_progress_by_overlap.png', **SAVEFIG_KWARGS)
     plt.close()
+    return 'draw_progress_by_overlap.png'
 
 def plot_symmetric_analysis(df, output_dir):
     """Analyze symmetry of draw outcomes"""
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     
-    # Calculate asymmetry metric
-    df['progress_sum'] = df['player_progress'] + df['opponent_progress']
-    df['progress_diff_abs'] = abs(df['player_progress'] - df['opponent_progress'])
-    
     # Scatter: sum vs difference
     scatter = axes[0, 0].scatter(df['progress_sum'], df['progress_diff_abs'], 
                                  alpha=0.6, s=80, c=df['overlap_pct'], 
-                                 cmap='RdYlGn_r', edgecolors='black', linewidth=0.5)
+                                 cmap='RdYlGn_r', edgecolors='black', linewidth=0.5,
+                                 rasterized=True)
     axes[0, 0].set_xlabel('Combined Progress (P1 + P2) (%)', fontsize=12, fontweight='bold')
     axes[0, 0].set_ylabel('Progress Asymmetry |P1 - P2| (%)', fontsize=12, fontweight='bold')
     axes[0, 0].set_title('Symmetry Analysis of Draw Games', fontsize=14, fontweight='bold')
@@ -235,22 +382,28 @@ def plot_symmetric_analysis(df, output_dir):
     cbar.set_label('Overlap %', fontsize=10)
     
     # Histogram of combined progress
-    axes[0, 1].hist(df['progress_sum'], bins=20, edgecolor='black', alpha=0.7, color='steelblue')
+    counts, edges = np.histogram(df['progress_sum'].to_numpy(), bins=20)
+    axes[0, 1].stairs(counts, edges, fill=True, edgecolor='black', linewidth=1,
+                      alpha=0.7, facecolor='steelblue')
     axes[0, 1].set_xlabel('Combined Progress (P1 + P2) (%)', fontsize=12, fontweight='bold')
     axes[0, 1].set_ylabel('Number of Draw Games', fontsize=12, fontweight='bold')
     axes[0, 1].set_title('Distribution of Combined Progress', fontsize=14, fontweight='bold')
     axes[0, 1].grid(True, alpha=0.3, axis='y')
     axes[0, 1].axvline(140, color='red', linestyle='--', alpha=0.3, label='140% (both 70%)')
-    axes[0, 1].legend()
-    
-    # Categorize draws
-    df['draw_type'] = 'Unknown'
-    df.loc[(df['player_progress'] < 50) & (df['opponent_progress'] < 50), 'draw_type'] = 'Both Stuck (<50%)'
-    df.loc[(df['player_progress'] >= 50) & (df['player_progress'] < 70) & 
-           (df['opponent_progress'] >= 50) & (df['opponent_progress'] < 70), 'draw_type'] = 'Both Mid (50-70%)'
-    df.loc[(df['player_progress'] >= 70) & (df['opponent_progress'] >= 70), 'draw_type'] = 'Both High (≥70%)'
-    df.loc[(df['player_progress'] >= 70) & (df['opponent_progress'] < 70), 'draw_type'] = 'P1 Ahead'
-    df.loc[(df['player_progress'] < 70) & (df['opponent_progress'] >= 70), 'draw_type'] = 'P2 Ahead'
+    axes[0, 1].legend(loc='upper left')
+    
+    # Categorize draws (the categories are disjoint, so one np.select suffices)
+    p1 = df['player_progress'].to_numpy()
+    p2 = df['opponent_progress'].to_numpy()
+    conditions = [
+        (p1 < 50) & (p2 < 50),
+        (p1 >= 50) & (p1 < 70) & (p2 >= 50) & (p2 < 70),
+        (p1 >= 70) & (p2 >= 70),
+        (p1 >= 70) & (p2 < 70),
+        (p1 < 70) & (p2 >= 70),
+    ]
+    choices = ['Both Stuck (<50%)', 'Both Mid (50-70%)', 'Both High (≥70%)', 'P1 Ahead', 'P2 Ahead']
+    df['draw_type'] = pd.Categorical(np.select(conditions, choices, default='Unknown'))
     
     draw_type_counts = df['draw_type'].value_counts()
     colors = ['#ff6b6b', '#feca57', '#48dbfb', '#1dd1a1', '#ee5a6f']
@@ -265,15 +418,14 @@ def plot_symmetric_analysis(df, output_dir):
     for i, v in enumerate(draw_type_counts.values):
         axes[1, 0].text(v + 0.5, i, str(v), va='center', fontweight='bold')
     
-    # Pie chart of draw types
-    axes[1, 1].pie(draw_type_counts, labels=draw_type_counts.index, autopct='%1.1f%%',
-                   startangle=90, colors=colors[:len(draw_type_counts)])
+    # Share of each draw type
+    plot_share_barh(axes[1, 1], draw_type_counts, colors[:len(draw_type_counts)])
     axes[1, 1].set_title('Proportion of Draw Types', fontsize=14, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'draw_symmetry_analysis.png', dpi=300, bbox_inches='tight')
-    print(f"✓ Saved: draw_symmetry_analysis.png")
+    plt.savefig(output_dir / 'draw_symmetry_analysis.png', **SAVEFIG_KWARGS)
     plt.close()
+    return 'draw_symmetry_analysis.png'
 
 def generate_summary_stats(df, output_dir):
     """Generate text summary of statistics"""
@@ -281,33 +433,43 @@ def generate_summary_stats(df, output_dir):
     summary.append("="*80)
     summary.append("DRAW GAME ANALYSIS SUMMARY")
     summary.append("="*80)
-    summary.append(f"\nTotal draw games analyzed: {len(df)}")
-    summary.append(f"\nPlayer 1 Average Progress: {df['player_progress'].mean():.1f}%")
-    summary.append(f"Player 1 Median Progress: {df['player_progress'].median():.1f}%")
-    summary.append(f"Player 1 Std Dev: {df['player_progress'].std():.1f}%")
-    summary.append(f"\nPlayer 2 Average Progress: {df['opponent_progress'].mean():.1f}%")
-    summary.append(f"Player 2 Median Progress: {df['opponent_progress'].median():.1f}%")
-    summary.append(f"Player 2 Std Dev: {df['opponent_progress'].std():.1f}%")
-    
-    summary.append(f"\nAverage Progress Difference: {abs(df['player_progress'] - df['opponent_progress']).mean():.1f}%")
-    summary.append(f"Median Progress Difference: {abs(df['player_progress'] - df['opponent_progress']).median():.1f}%")
-    
-    summary.append(f"\nAverage Pattern Overlap: {df['overlap_pct'].mean():.1f}%")
-    summary.append(f"Exact Pattern Matches: {(df['overlap_pct'] >= 100).sum()} ({(df['overlap_pct'] >= 100).sum()/len(df)*100:.1f}%)")
+    # One array per column; the differences and quadrant masks are built once
+    p1 = df['player_progress'].to_numpy(dtype=np.float64)
+    p2 = df['opponent_progress'].to_numpy(dtype=np.float64)
+    overlap = df['overlap_pct'].to_numpy(dtype=np.float64)
+    diff_abs = df['progress_diff_abs'].to_numpy()
+    n = len(df)
+    
+    summary.append(f"\nTotal draw games analyzed: {n}")
+    summary.append(f"\nPlayer 1 Average Progress: {p1.mean():.1f}%")
+    summary.append(f"Player 1 Median Progress: {np.median(p1):.1f}%")
+    summary.append(f"Player 1 Std Dev: {p1.std(ddof=1):.1f}%")
+    summary.append(f"\nPlayer 2 Average Progress: {p2.mean():.1f}%")
+    summary.append(f"Player 2 Median Progress: {np.median(p2):.1f}%")
+    summary.append(f"Player 2 Std Dev: {p2.std(ddof=1):.1f}%")
+    
+    summary.append(f"\nAverage Progress Difference: {diff_abs.mean():.1f}%")
+    summary.append(f"Median Progress Difference: {np.median(diff_abs):.1f}%")
+    
+    exact_matches = np.count_nonzero(overlap >= 100)
+    summary.append(f"\nAverage Pattern Overlap: {overlap.mean():.1f}%")
+    summary.append(f"Exact Pattern Matches: {exact_matches} ({exact_matches/n*100:.1f}%)")
     
     summary.append(f"\nAverage Turns to Draw: {df['final_turn'].mean():.1f}")
     
     # Quadrant analysis
-    both_high = ((df['player_progress'] >= 70) & (df['opponent_progress'] >= 70)).sum()
-    both_stuck = ((df['player_progress'] < 70) & (df['opponent_progress'] < 70)).sum()
-    p1_ahead = ((df['player_progress'] >= 70) & (df['opponent_progress'] < 70)).sum()
-    p2_ahead = ((df['player_progress'] < 70) & (df['opponent_progress'] >= 70)).sum()
+    p1_high = p1 >= 70
+    p2_high = p2 >= 70
+    both_high = np.count_nonzero(p1_high & p2_high)
+    both_stuck = np.count_nonzero(~p1_high & ~p2_high)
+    p1_ahead = np.count_nonzero(p1_high & ~p2_high)
+    p2_ahead = np.count_nonzero(~p1_high & p2_high)
     
     summary.append(f"\nQuadrant Analysis:")
-    summary.append(f"  Both High (≥70%): {both_high} ({both_high/len(df)*100:.1f}%)")
-    summary.append(f"  Both Stuck (<70%): {both_stuck} ({both_stuck/len(df)*100:.1f}%)")
-    summary.append(f"  P1 Ahead: {p1_ahead} ({p1_ahead/len(df)*100:.1f}%)")
-    summary.append(f"  P2 Ahead: {p2_ahead} ({p2_ahead/len(df)*100:.1f}%)")
+    summary.append(f"  Both High (≥70%): {both_high} ({both_high/n*100:.1f}%)")
+    summary.append(f"  Both Stuck (<70%): {both_stuck} ({both_stuck/n*100:.1f}%)")
+    summary.append(f"  P1 Ahead: {p1_ahead} ({p1_ahead/n*100:.1f}%)")
+    summary.append(f"  P2 Ahead: {p2_ahead} ({p2_ahead/n*100:.1f}%)")
     
     summary.append("\n" + "="*80)
     
@@ -318,11 +480,28 @@ def generate_summary_stats(df, output_dir):
         f.write(summary_text)
     print(f"\n✓ Saved: draw_analysis_summary.txt")
 
-def main():
-    # Set style
+PLOTS = [
+    plot_progress_scatter,
+    plot_progress_difference_histogram,
+    plot_progress_heatmap,
+    plot_progress_by_overlap,
+    plot_symmetric_analysis,
+]
+
+def set_style():
+    """Plot style shared by the main process and every worker"""
     sns.set_style("whitegrid")
     plt.rcParams['font.family'] = 'sans-serif'
     plt.rcParams['font.sans-serif'] = ['Arial']
+
+def render(job):
+    """Draw one (plot function, df, output_dir) job in a worker process"""
+    plot, df, output_dir = job
+    return plot(df, output_dir)
+
+def main():
+    # Set style
+    set_style()
     
     # Get CSV path from command line or use default
     if len(sys.argv) > 1:
@@ -354,13 +533,12 @@ def main():
     output_dir.mkdir(exist_ok=True)
     print(f"Output directory: {output_dir}\n")
     
-    # Generate plots
+    # Generate plots; the figures are independent, so each renders in its own process
     print("Generating visualizations...")
-    plot_progress_scatter(df, output_dir)
-    plot_progress_difference_histogram(df, output_dir)
-    plot_progress_heatmap(df, output_dir)
-    plot_progress_by_overlap(df, output_dir)
-    plot_symmetric_analysis(df, output_dir)
+    jobs = [(plot, df, output_dir) for plot in PLOTS]
+    with ProcessPoolExecutor(max_workers=len(jobs), initializer=set_style) as pool:
+        for filename in pool.map(render, jobs):
+            print(f"✓ Saved: {filename}")
     
     # Generate summary
     print("\nGenerating summary statistics...")